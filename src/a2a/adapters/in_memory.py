@@ -8,7 +8,6 @@ and support correlation ID propagation and basic tracing.
 
 import asyncio
 from collections import defaultdict
-from datetime import datetime, timedelta
 from typing import Callable, Dict, List, Optional
 
 from src.a2a.protocol import A2AMessage
@@ -32,6 +31,8 @@ class InMemoryA2AAdapter:
         self._message_history: List[A2AMessage] = []
         self._max_history: int = 1000
         self._lock = asyncio.Lock()
+        # Futures of receive_message calls waiting for an agent's next message
+        self._waiters: Dict[str, List[asyncio.Future]] = defaultdict(list)
     
     async def send_message(
         self,
@@ -61,8 +62,11 @@ class InMemoryA2AAdapter:
                 )
                 return False
             
-            # Add to queue
+            # Add to queue and wake receivers waiting on this agent
             self._queues[target].append(message)
+            for waiter in self._waiters.pop(target, []):
+                if not waiter.done():
+                    waiter.set_result(None)
             
             # Add to history (limited)
             self._message_history.append(message)
@@ -103,42 +107,51 @@ class InMemoryA2AAdapter:
         agent_id: str,
         timeout: Optional[float] = None,
         message_type: Optional[str] = None,
+        correlation_id: Optional[str] = None,
     ) -> Optional[A2AMessage]:
         """
         Receive the next message from an agent's queue.
         
+        Waits until a matching message is sent rather than polling.
+        
         Args:
             agent_id: Agent identifier
             timeout: Optional timeout in seconds
             message_type: Optional filter by message type
+            correlation_id: Optional filter by correlation ID
             
         Returns:
             Next message or None if timeout/queue empty
         """
-        start_time = datetime.utcnow()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
         
         while True:
             async with self._lock:
                 queue = self._queues.get(agent_id, [])
+                for i, msg in enumerate(queue):
+                    if message_type and msg.message_type != message_type:
+                        continue
+                    if correlation_id and msg.correlation_id != correlation_id:
+                        continue
+                    return queue.pop(i)
                 
-                # Filter by message type if specified
-                if message_type:
-                    for i, msg in enumerate(queue):
-                        if msg.message_type == message_type:
-                            return queue.pop(i)
-                elif queue:
-                    return queue.pop(0)
-            
-            # Check timeout
-            if timeout is not None:
-                elapsed = (datetime.utcnow() - start_time).total_seconds()
-                if elapsed >= timeout:
+                if deadline is None:
                     return None
-            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                
+                arrived = loop.create_future()
+                self._waiters[agent_id].append(arrived)
+            
+            try:
+                await asyncio.wait_for(arrived, remaining)
+            except asyncio.TimeoutError:
+                waiters = self._waiters.get(agent_id)
+                if waiters and arrived in waiters:
+                    waiters.remove(arrived)
                 return None
-            
-            # Brief sleep before retry
-            await asyncio.sleep(0.1)
     
     async def subscribe(
         self,
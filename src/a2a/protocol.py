@@ -21,7 +21,8 @@ import hashlib
 import hmac
 import json
 import uuid
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
@@ -95,6 +96,19 @@ class A2AMessage(BaseModel):
         return json.dumps(self.to_dict(), sort_keys=True)
 
 
+def _canonical_default(obj: Any) -> Any:
+    """Encode the non-JSON types that may appear in message payloads."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Shared encoder for signing; sorted keys keep the representation deterministic
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, default=_canonical_default)
+
+
 def compute_hmac_signature(message: A2AMessage, secret: str) -> str:
     """
     Compute HMAC-SHA256 signature for a message.
@@ -107,22 +121,9 @@ def compute_hmac_signature(message: A2AMessage, secret: str) -> str:
         Hexadecimal HMAC signature
     """
     # Create canonical representation (excluding signature field)
-    message_dict = message.to_dict()
-    message_dict.pop("signature", None)
-    
-    # Custom JSON encoder to handle Decimal and datetime types
-    class CustomEncoder(json.JSONEncoder):
-        def default(self, obj):
-            from decimal import Decimal
-            from datetime import datetime, date
-            if isinstance(obj, Decimal):
-                return float(obj)
-            if isinstance(obj, (datetime, date)):
-                return obj.isoformat()
-            return super().default(obj)
-    
-    # Sort keys for deterministic signing
-    canonical = json.dumps(message_dict, sort_keys=True, cls=CustomEncoder)
+    message_dict = message.model_dump(exclude={"signature"})
+    message_dict["timestamp"] = message.timestamp.isoformat()
+    canonical = _CANONICAL_ENCODER.encode(message_dict)
     
     # Compute HMAC
     signature = hmac.new(
@@ -260,8 +260,16 @@ class ADKAgent:
                 llm_response = await groq.chat(
                     prompt=prompt,
                     system_prompt="You are a budget optimization expert. Analyze travel itineraries and suggest cost-cutting measures while maintaining quality. Return JSON only with optimized itinerary and specific changes made.",
-                    temperature=0.5,
+                    # Deterministic, so a repeated proposal can be answered
+                    # from the LLM response cache when it is enabled
+                    temperature=0,
                     max_tokens=2500,
+                    cache_scope=(
+                        proposal_data.get("destination"),
+                        proposal_data.get("estimated_total"),
+                        budget_max,
+                        currency,
+                    ),
                 )
             
             # Parse LLM response
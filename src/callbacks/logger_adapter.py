@@ -5,7 +5,7 @@ Forwards MonitoringEvent instances to structured logger for persistence.
 """
 
 import json
-from typing import Optional, TextIO
+from typing import Any, Dict, List, Optional, TextIO
 
 from src.models.itinerary import MonitoringEvent
 from src.logging.json_logger import get_logger
@@ -44,6 +44,48 @@ class MonitoringLoggerAdapter:
         Args:
             event: MonitoringEvent to log
         """
+        log_dict = self._log_to_console(event)
+        
+        # Write to file if configured
+        if self._file_handle:
+            try:
+                json_line = json.dumps(log_dict) + "\n"
+                self._file_handle.write(json_line)
+                self._file_handle.flush()
+            except Exception as e:
+                logger.error(f"Failed to write monitoring event to file: {e}")
+    
+    def log_events(self, events: List[MonitoringEvent]) -> None:
+        """
+        Log a batch of monitoring events.
+        
+        Events go to the console one by one, but the file receives the
+        whole batch in a single write and flush.
+        
+        Args:
+            events: MonitoringEvents to log, in emission order
+        """
+        log_dicts = [self._log_to_console(event) for event in events]
+        
+        if self._file_handle and log_dicts:
+            try:
+                self._file_handle.write(
+                    "".join(json.dumps(log_dict) + "\n" for log_dict in log_dicts)
+                )
+                self._file_handle.flush()
+            except Exception as e:
+                logger.error(f"Failed to write monitoring events to file: {e}")
+    
+    def _log_to_console(self, event: MonitoringEvent) -> Dict[str, Any]:
+        """
+        Write an event to the structured logger.
+        
+        Args:
+            event: MonitoringEvent to log
+            
+        Returns:
+            The event's log dictionary, for reuse by file output
+        """
         # Convert to log dictionary
         log_dict = event.to_log_dict()
         
@@ -69,15 +111,7 @@ class MonitoringLoggerAdapter:
             event.message,
             extra=safe_extra,
         )
-        
-        # Write to file if configured
-        if self._file_handle:
-            try:
-                json_line = json.dumps(log_dict) + "\n"
-                self._file_handle.write(json_line)
-                self._file_handle.flush()
-            except Exception as e:
-                logger.error(f"Failed to write monitoring event to file: {e}")
+        return log_dict
     
     def _get_log_level(self, severity: str) -> int:
         """
@@ -115,18 +149,23 @@ class MonitoringLoggerAdapter:
         self.close()
 
 
-def create_monitoring_listener(log_file: Optional[str] = None) -> tuple:
+def create_monitoring_listener(log_file: Optional[str] = None, batch: bool = False) -> tuple:
     """
     Create a monitoring listener function and adapter.
     
     Args:
         log_file: Optional file path for event logs
+        batch: Return a listener taking lists of events, for use with
+            MonitoringCallbacks.register_listener(listener, batch=True)
         
     Returns:
         Tuple of (listener_function, adapter_instance)
     """
     adapter = MonitoringLoggerAdapter(log_file)
     
+    if batch:
+        return adapter.log_events, adapter
+    
     def listener(event: MonitoringEvent) -> None:
         """Listener function that forwards events to adapter."""
         adapter.log_event(event)
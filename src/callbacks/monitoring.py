@@ -5,15 +5,19 @@ Provides callback functions that emit MonitoringEvent instances
 for observability and debugging.
 """
 
-import uuid
+import secrets
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from src.models.itinerary import EventSeverity, EventType, MonitoringEvent
 from src.logging.json_logger import get_logger
 
 logger = get_logger(__name__)
 
+# Events at these severities are delivered to batch listeners right away
+_FLUSH_SEVERITIES = frozenset({EventSeverity.ERROR, EventSeverity.CRITICAL})
+
 
 class MonitoringCallbacks:
     """
@@ -21,28 +25,41 @@ class MonitoringCallbacks:
     
     These callbacks track task lifecycle, state changes, and errors,
     emitting structured MonitoringEvent instances.
+    
+    Listeners either receive each event as it happens, or (registered
+    with batch=True) receive lists of events once batch_size have
+    queued up, an error occurs, or flush() is called.
     """
     
-    def __init__(self, trace_id: str, correlation_id: str) -> None:
+    def __init__(self, trace_id: str, correlation_id: str, batch_size: int = 32) -> None:
         """
         Initialize monitoring callbacks.
         
         Args:
             trace_id: Distributed trace ID
             correlation_id: Request correlation ID
+            batch_size: Number of queued events that triggers a batch flush
         """
         self.trace_id = trace_id
         self.correlation_id = correlation_id
+        self.batch_size = batch_size
         self._listeners: List[Callable[[MonitoringEvent], None]] = []
+        self._batch_listeners: List[Callable[[List[MonitoringEvent]], None]] = []
+        self._batch: Deque[MonitoringEvent] = deque()
     
-    def register_listener(self, listener: Callable[[MonitoringEvent], None]) -> None:
+    def register_listener(self, listener: Callable[..., None], batch: bool = False) -> None:
         """
         Register a listener for monitoring events.
         
         Args:
-            listener: Callback function that receives MonitoringEvent
+            listener: Callback function that receives a MonitoringEvent, or
+                a list of them if batch is True
+            batch: Deliver events in batches (call flush() when done)
         """
-        self._listeners.append(listener)
+        if batch:
+            self._batch_listeners.append(listener)
+        else:
+            self._listeners.append(listener)
     
     def _emit_event(self, event: MonitoringEvent) -> None:
         """
@@ -56,6 +73,53 @@ class MonitoringCallbacks:
                 listener(event)
             except Exception as e:
                 logger.error(f"Error in monitoring listener: {e}")
+        
+        if self._batch_listeners:
+            self._batch.append(event)
+            if len(self._batch) >= self.batch_size or event.severity in _FLUSH_SEVERITIES:
+                self.flush()
+    
+    def flush(self) -> None:
+        """Deliver any queued events to batch listeners."""
+        if not self._batch:
+            return
+        events = list(self._batch)
+        self._batch.clear()
+        for listener in self._batch_listeners:
+            try:
+                listener(events)
+            except Exception as e:
+                logger.error(f"Error in monitoring listener: {e}")
+    
+    def _new_event(
+        self,
+        event_type: EventType,
+        severity: EventSeverity,
+        task_id: Optional[str],
+        agent_id: Optional[str],
+        message: str,
+        data: Dict[str, Any],
+        error: Optional[Dict[str, str]] = None,
+    ) -> MonitoringEvent:
+        """
+        Build an event carrying this instance's trace and correlation IDs.
+        
+        Events are validated normally: for a model this small pydantic's
+        compiled validator is faster than model_construct.
+        """
+        return MonitoringEvent(
+            event_id=secrets.token_hex(16),
+            event_type=event_type,
+            severity=severity,
+            timestamp=datetime.utcnow(),
+            trace_id=self.trace_id,
+            correlation_id=self.correlation_id,
+            task_id=task_id,
+            agent_id=agent_id,
+            message=message,
+            data=data,
+            error=error,
+        )
     
     def on_task_start(
         self,
@@ -73,16 +137,13 @@ class MonitoringCallbacks:
             message: Event message
             data: Additional event data
         """
-        event = MonitoringEvent(
-            event_id=str(uuid.uuid4()),
-            event_type=EventType.TASK_START,
-            severity=EventSeverity.INFO,
-            trace_id=self.trace_id,
-            correlation_id=self.correlation_id,
-            task_id=task_id,
-            agent_id=agent_id,
-            message=message,
-            data=data or {},
+        event = self._new_event(
+            EventType.TASK_START,
+            EventSeverity.INFO,
+            task_id,
+            agent_id,
+            message,
+            data or {},
         )
         
         self._emit_event(event)
@@ -119,16 +180,13 @@ class MonitoringCallbacks:
         event_data = data or {}
         event_data["progress"] = progress
         
-        event = MonitoringEvent(
-            event_id=str(uuid.uuid4()),
-            event_type=EventType.TASK_PROGRESS,
-            severity=EventSeverity.INFO,
-            trace_id=self.trace_id,
-            correlation_id=self.correlation_id,
-            task_id=task_id,
-            agent_id=agent_id,
-            message=message,
-            data=event_data,
+        event = self._new_event(
+            EventType.TASK_PROGRESS,
+            EventSeverity.INFO,
+            task_id,
+            agent_id,
+            message,
+            event_data,
         )
         
         self._emit_event(event)
@@ -161,16 +219,13 @@ class MonitoringCallbacks:
             message: Event message
             data: Additional event data
         """
-        event = MonitoringEvent(
-            event_id=str(uuid.uuid4()),
-            event_type=EventType.TASK_END,
-            severity=EventSeverity.INFO,
-            trace_id=self.trace_id,
-            correlation_id=self.correlation_id,
-            task_id=task_id,
-            agent_id=agent_id,
-            message=message,
-            data=data or {},
+        event = self._new_event(
+            EventType.TASK_END,
+            EventSeverity.INFO,
+            task_id,
+            agent_id,
+            message,
+            data or {},
         )
         
         self._emit_event(event)
@@ -206,16 +261,13 @@ class MonitoringCallbacks:
         """
         error_message = message or f"Task error: {str(error)}"
         
-        event = MonitoringEvent(
-            event_id=str(uuid.uuid4()),
-            event_type=EventType.TASK_ERROR,
-            severity=EventSeverity.ERROR,
-            trace_id=self.trace_id,
-            correlation_id=self.correlation_id,
-            task_id=task_id,
-            agent_id=agent_id,
-            message=error_message,
-            data=data or {},
+        event = self._new_event(
+            EventType.TASK_ERROR,
+            EventSeverity.ERROR,
+            task_id,
+            agent_id,
+            error_message,
+            data or {},
             error={
                 "type": type(error).__name__,
                 "message": str(error),
@@ -258,16 +310,13 @@ class MonitoringCallbacks:
         """
         event_message = message or f"State changed: {key}"
         
-        event = MonitoringEvent(
-            event_id=str(uuid.uuid4()),
-            event_type=EventType.STATE_CHANGE,
-            severity=EventSeverity.DEBUG,
-            trace_id=self.trace_id,
-            correlation_id=self.correlation_id,
-            task_id=task_id,
-            agent_id=agent_id,
-            message=event_message,
-            data={
+        event = self._new_event(
+            EventType.STATE_CHANGE,
+            EventSeverity.DEBUG,
+            task_id,
+            agent_id,
+            event_message,
+            {
                 "key": key,
                 "old_value": str(old_value) if old_value is not None else None,
                 "new_value": str(new_value) if new_value is not None else None,
@@ -309,16 +358,13 @@ class MonitoringCallbacks:
         event_data = data or {}
         event_data["message_type"] = message_type
         
-        event = MonitoringEvent(
-            event_id=str(uuid.uuid4()),
-            event_type=EventType.AGENT_MESSAGE,
-            severity=EventSeverity.INFO,
-            trace_id=self.trace_id,
-            correlation_id=self.correlation_id,
-            task_id=task_id,
-            agent_id=agent_id,
-            message=message,
-            data=event_data,
+        event = self._new_event(
+            EventType.AGENT_MESSAGE,
+            EventSeverity.INFO,
+            task_id,
+            agent_id,
+            message,
+            event_data,
         )
         
         self._emit_event(event)
@@ -5,6 +5,7 @@ Uses Pydantic BaseSettings to automatically load and validate configuration
 from environment variables and .env files.
 """
 
+import threading
 from typing import Optional
 
 from pydantic import Field
@@ -28,6 +29,10 @@ class Settings(BaseSettings):
     # External API Keys
     groq_api_key: Optional[str] = Field(default=None, description="Groq API key")
     groq_model: str = Field(default="llama-3.3-70b-versatile", description="Groq model to use")
+    groq_compress_requests: bool = Field(
+        default=False,
+        description="Gzip large Groq request bodies (endpoint must accept Content-Encoding: gzip)"
+    )
     gemini_api_key: Optional[str] = Field(default=None, description="Gemini API key")
     gemini_model: str = Field(
         default="gemini-2.0-flash",
@@ -43,6 +48,27 @@ class Settings(BaseSettings):
     # Monitoring
     enable_monitoring: bool = Field(default=True, description="Enable monitoring callbacks")
     
+    # LLM response caching
+    enable_llm_response_cache: bool = Field(
+        default=False,
+        description="Serve exact repeats of temperature-0 LLM prompts from a local cache"
+    )
+    enable_llm_semantic_cache: bool = Field(
+        default=False,
+        description="Serve semantically similar LLM prompts from a local cache"
+    )
+    llm_cache_similarity_threshold: float = Field(
+        default=0.92,
+        description="Minimum cosine similarity for a semantic cache hit"
+    )
+    
+    # MCP tool invocation
+    mcp_max_concurrent_per_tool: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum concurrent in-flight invocations per MCP tool"
+    )
+    
     # Feature Flags
     allow_booking_operations: bool = Field(
         default=False,
@@ -74,18 +100,23 @@ class Settings(BaseSettings):
 
 # Global settings instance
 _settings: Optional[Settings] = None
+# Guards first construction only; sync MCP tools may call in from worker threads
+_settings_lock = threading.Lock()
 
 
 def get_settings() -> Settings:
     """Get the global settings instance (singleton pattern)."""
     global _settings
     if _settings is None:
-        _settings = Settings()
+        with _settings_lock:
+            if _settings is None:
+                _settings = Settings()
     return _settings
 
 
 def reload_settings() -> Settings:
     """Reload settings from environment (useful for testing)."""
     global _settings
-    _settings = Settings()
+    with _settings_lock:
+        _settings = Settings()
     return _settings
@@ -5,8 +5,10 @@ Provides helper functions for currency conversion, budget tracking,
 and financial calculations in travel planning.
 """
 
+import asyncio
+import time
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -41,10 +43,14 @@ class BudgetCalculator:
     
     NOTE: This is a stub implementation. In production:
     1. Integrate with a currency API (e.g., exchangerate-api.com, fixer.io)
-    2. Cache exchange rates with TTL
-    3. Handle rate updates and historical data
+    2. Handle rate updates and historical data
+    
+    Exchange rates are cached per currency pair for RATE_CACHE_TTL_SECONDS.
     """
     
+    RATE_CACHE_TTL_SECONDS = 600
+    RATE_CACHE_MAX_ENTRIES = 256
+    
     # Mock exchange rates (relative to USD)
     MOCK_RATES: Dict[str, Decimal] = {
         "USD": Decimal("1.0"),
@@ -67,6 +73,8 @@ class BudgetCalculator:
         """
         self.api_key = api_key
         self.default_currency = "USD"
+        # (from_currency, to_currency) -> (rate, expires_at)
+        self._rate_cache: Dict[Tuple[str, str], Tuple[CurrencyRate, float]] = {}
     
     async def get_exchange_rate(
         self,
@@ -83,6 +91,12 @@ class BudgetCalculator:
         Returns:
             Exchange rate information
         """
+        pair = (from_currency, to_currency)
+        now = time.monotonic()
+        cached = self._rate_cache.get(pair)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        
         # TODO: Implement real API call to currency service
         logger.info(f"Getting exchange rate: {from_currency} -> {to_currency}")
         
@@ -95,12 +109,23 @@ class BudgetCalculator:
             # Real API call would go here
             rate = Decimal("1.0")
         
-        return CurrencyRate(
+        rate_info = CurrencyRate(
             from_currency=from_currency,
             to_currency=to_currency,
             rate=rate,
             timestamp="2025-11-18T00:00:00Z",
         )
+        
+        if len(self._rate_cache) >= self.RATE_CACHE_MAX_ENTRIES:
+            # Drop expired pairs first, then the oldest insertion
+            self._rate_cache = {
+                key: value for key, value in self._rate_cache.items() if value[1] > now
+            }
+            if len(self._rate_cache) >= self.RATE_CACHE_MAX_ENTRIES:
+                del self._rate_cache[next(iter(self._rate_cache))]
+        self._rate_cache[pair] = (rate_info, now + self.RATE_CACHE_TTL_SECONDS)
+        
+        return rate_info
     
     async def convert(
         self,
@@ -152,7 +177,7 @@ class BudgetCalculator:
             rate=rate_info.rate,
         )
     
-    def calculate_total(
+    async def calculate_total_async(
         self,
         amounts: Dict[str, Decimal],
         target_currency: Optional[str] = None,
@@ -160,6 +185,9 @@ class BudgetCalculator:
         """
         Calculate total from multiple amounts in different currencies.
         
+        Exchange rates for all foreign currencies are fetched concurrently
+        up front, so N currencies cost one round trip instead of N.
+        
         Args:
             amounts: Dictionary of {currency: amount}
             target_currency: Target currency (uses default if not provided)
@@ -170,20 +198,41 @@ class BudgetCalculator:
         if target_currency is None:
             target_currency = self.default_currency
         
-        # Note: This should be async in production to fetch rates
+        unique = [currency for currency in amounts if currency != target_currency]
+        rate_infos = await asyncio.gather(
+            *(self.get_exchange_rate(currency, target_currency) for currency in unique)
+        )
+        rates = {currency: info.rate for currency, info in zip(unique, rate_infos)}
+        
         total = Decimal("0.0")
         for currency, amount in amounts.items():
             if currency == target_currency:
                 total += amount
             else:
-                # Simplified conversion using mock rates
-                from_rate = self.MOCK_RATES.get(currency, Decimal("1.0"))
-                to_rate = self.MOCK_RATES.get(target_currency, Decimal("1.0"))
-                rate = to_rate / from_rate
-                total += amount * rate
+                total += amount * rates[currency]
         
         return total.quantize(Decimal("0.01"))
     
+    def calculate_total(
+        self,
+        amounts: Dict[str, Decimal],
+        target_currency: Optional[str] = None,
+    ) -> Decimal:
+        """
+        Synchronous wrapper around calculate_total_async().
+        
+        Runs its own event loop, so it cannot be called from async code;
+        await calculate_total_async() there instead.
+        
+        Args:
+            amounts: Dictionary of {currency: amount}
+            target_currency: Target currency (uses default if not provided)
+            
+        Returns:
+            Total in target currency
+        """
+        return asyncio.run(self.calculate_total_async(amounts, target_currency))
+    
     def is_within_budget(
         self,
         total_cost: Decimal,
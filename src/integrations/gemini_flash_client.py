@@ -6,10 +6,11 @@ Used for text generation and natural language processing.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Final, List, Optional
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.config.settings import get_settings
 from src.logging.json_logger import get_logger
@@ -26,6 +27,7 @@ class GeminiMessage(BaseModel):
 
 class GeminiGenerationConfig(BaseModel):
     """Configuration for text generation."""
+    model_config = ConfigDict(frozen=True)
     
     temperature: float = Field(default=0.7, description="Sampling temperature")
     max_tokens: int = Field(default=1024, description="Maximum tokens to generate")
@@ -33,6 +35,52 @@ class GeminiGenerationConfig(BaseModel):
     top_k: int = Field(default=40, description="Top-k sampling parameter")
 
 
+# Shared default used when generate() is called without a config (safe since it's frozen)
+_DEFAULT_GEN_CONFIG: Final = GeminiGenerationConfig()
+
+
+@dataclass(frozen=True)
+class GeminiPayload:
+    """
+    Request body for the Gemini generateContent endpoint.
+    
+    A fixed-shape slotted object instead of nested per-request dicts;
+    converted to the wire format only when the request is sent.
+    """
+    
+    __slots__ = ("contents", "generation_config", "system_instruction")
+    
+    contents: List[Dict[str, Any]]
+    generation_config: Dict[str, Any]
+    system_instruction: Optional[Dict[str, Any]]
+    
+    @classmethod
+    def from_prompt(
+        cls,
+        prompt: str,
+        generation_config: Dict[str, Any],
+        system_instruction: Optional[str] = None,
+    ) -> "GeminiPayload":
+        """Build a single-turn payload from a prompt."""
+        return cls(
+            contents=[{"parts": [{"text": prompt}]}],
+            generation_config=generation_config,
+            system_instruction=(
+                {"parts": [{"text": system_instruction}]} if system_instruction else None
+            ),
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the JSON body expected by the Gemini API."""
+        body: Dict[str, Any] = {
+            "contents": self.contents,
+            "generationConfig": self.generation_config,
+        }
+        if self.system_instruction is not None:
+            body["systemInstruction"] = self.system_instruction
+        return body
+
+
 class GeminiResponse(BaseModel):
     """Response from Gemini API."""
     
@@ -92,8 +140,7 @@ class GeminiFlashClient:
         Returns:
             Generated response
         """
-        if config is None:
-            config = GeminiGenerationConfig()
+        config = config or _DEFAULT_GEN_CONFIG
         
         logger.info(
             f"Gemini generate: {prompt[:100]}...",
@@ -113,20 +160,18 @@ class GeminiFlashClient:
         try:
             url = f"{self.base_url}/models/{self.model}:generateContent"
             params = {"key": self.api_key}
-            payload = {
-                "contents": [{"parts": [{"text": prompt}]}],
-                "generationConfig": {
+            payload = GeminiPayload.from_prompt(
+                prompt,
+                generation_config={
                     "temperature": config.temperature,
                     "maxOutputTokens": config.max_tokens,
                     "topP": config.top_p,
                     "topK": config.top_k,
                 },
-            }
-            
-            if system_instruction:
-                payload["systemInstruction"] = {"parts": [{"text": system_instruction}]}
+                system_instruction=system_instruction,
+            )
             
-            response = await self._client.post(url, params=params, json=payload)
+            response = await self._client.post(url, params=params, json=payload.to_dict())
             response.raise_for_status()
             data = response.json()
             
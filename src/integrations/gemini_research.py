@@ -5,14 +5,18 @@ Uses Google's Gemini 2.0 Flash model to research destinations,
 weather, accommodations, and attractions with real-time information.
 """
 
+import asyncio
 import json
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 from pydantic import BaseModel, Field
 
 from src.config.settings import get_settings
+from src.integrations.gemini_flash_client import GeminiPayload
 from src.logging.json_logger import get_logger
+from src.utils.http import get_http_client
+from src.utils.text import strip_code_fence
 
 logger = get_logger(__name__)
 
@@ -28,6 +32,33 @@ class ResearchResult(BaseModel):
     currency: str = Field(description="Local currency code")
     travel_tips: str = Field(description="Important travel tips and advice")
     best_time_to_visit: str = Field(description="Best time/season to visit")
+    is_mock: bool = Field(
+        default=False,
+        description="True when this is placeholder data rather than real research"
+    )
+
+
+class TripQuery(BaseModel):
+    """A single destination to research as part of a multi-city trip."""
+    
+    destination: str = Field(description="Destination city/location")
+    start_date: str = Field(description="Trip start date (YYYY-MM-DD)")
+    end_date: str = Field(description="Trip end date (YYYY-MM-DD)")
+    home_location: str = Field(description="Traveler's home city")
+    budget_range: tuple[float, float] = Field(description="(min, max) budget tuple")
+    currency: str = Field(default="INR", description="Currency code")
+
+
+# Above this many trips a single prompt risks the output token limit,
+# so research_destinations() falls back to one concurrent call per trip.
+MAX_BATCH_DESTINATIONS = 5
+
+
+def _format_value(value: Any) -> str:
+    """Convert nested objects to formatted strings."""
+    if isinstance(value, dict):
+        return json.dumps(value, indent=2, ensure_ascii=False)
+    return str(value)
 
 
 class GeminiResearchClient:
@@ -47,8 +78,11 @@ class GeminiResearchClient:
         if not self.api_key or self.api_key == "placeholder-gemini-key":
             logger.warning("Gemini API key not configured - research will use mock data")
             self.api_key = None
-        
-        self._client = httpx.AsyncClient(timeout=30.0)
+    
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """Shared HTTP client (borrowed, not owned)."""
+        return get_http_client()
     
     async def research_destination(
         self,
@@ -119,81 +153,174 @@ Respond ONLY with valid JSON in this exact format:
     "best_time_to_visit": "timing analysis..."
 }}"""
 
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
-            
-            payload = {
-                "contents": [{
-                    "parts": [{"text": prompt}]
-                }],
-                "generationConfig": {
-                    "temperature": 0.7,
-                    "topK": 40,
-                    "topP": 0.95,
-                    "maxOutputTokens": 2048,
-                }
-            }
-            
-            headers = {"Content-Type": "application/json"}
-            
-            response = await self._client.post(
-                url,
-                params={"key": self.api_key},
-                json=payload,
-                headers=headers,
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            # Extract text from Gemini response
-            if "candidates" in result and len(result["candidates"]) > 0:
-                text = result["candidates"][0]["content"]["parts"][0]["text"]
-                
-                # Try to parse JSON from the response
-                # Gemini might wrap it in markdown code blocks
-                text = text.strip()
-                if text.startswith("```json"):
-                    text = text[7:]
-                if text.startswith("```"):
-                    text = text[3:]
-                if text.endswith("```"):
-                    text = text[:-3]
-                text = text.strip()
-                
-                research_data = json.loads(text)
-                
-                # Convert nested objects to formatted strings
-                def format_value(value):
-                    if isinstance(value, dict):
-                        return json.dumps(value, indent=2, ensure_ascii=False)
-                    return str(value)
-                
-                formatted_data = {
-                    "destination": research_data.get("destination", destination),
-                    "weather_summary": format_value(research_data.get("weather_summary", "")),
-                    "accommodation_suggestions": format_value(research_data.get("accommodation_suggestions", "")),
-                    "top_attractions": format_value(research_data.get("top_attractions", "")),
-                    "estimated_daily_cost": float(research_data.get("estimated_daily_cost", 5000)),
-                    "currency": research_data.get("currency", currency),
-                    "travel_tips": format_value(research_data.get("travel_tips", "")),
-                    "best_time_to_visit": format_value(research_data.get("best_time_to_visit", "")),
-                }
-                
-                logger.info(f"Successfully researched {destination}")
-                return ResearchResult(**formatted_data)
-            else:
+            text = await self._generate(prompt, max_output_tokens=2048)
+            if text is None:
                 logger.error("No candidates in Gemini response")
                 return await self._mock_research(destination, currency)
+            
+            research_data = json.loads(strip_code_fence(text))
+            logger.info(f"Successfully researched {destination}")
+            return self._to_result(research_data, destination, currency)
                 
         except Exception as e:
             logger.error(f"Gemini research error: {e}", exc_info=True)
             return await self._mock_research(destination, currency)
     
+    async def research_destinations(self, trips: List[TripQuery]) -> List[ResearchResult]:
+        """
+        Research several destinations of a multi-city trip in one Gemini call.
+        
+        All trips share a single prompt and response, saving N-1 round trips
+        over calling research_destination() per city. Batching cuts latency,
+        not token cost, so repeated trips still benefit from caching results.
+        More than MAX_BATCH_DESTINATIONS trips are researched with concurrent
+        per-destination calls instead to stay under the output token limit,
+        as are trips whose batch call fails or does not return one JSON
+        object per trip.
+        
+        Args:
+            trips: Destinations to research, in itinerary order
+            
+        Returns:
+            One research result per trip, in the same order
+        """
+        if not trips:
+            return []
+        
+        if len(trips) == 1 or len(trips) > MAX_BATCH_DESTINATIONS or not self.api_key:
+            return await self._research_each(trips)
+        
+        logger.info(
+            f"Researching {len(trips)} destinations using Gemini {self.model}",
+            extra={"destinations": [trip.destination for trip in trips]},
+        )
+        
+        try:
+            trip_blocks = "\n\n".join(
+                f"""Trip {i}:
+- Destination: {trip.destination}
+- Travel Dates: {trip.start_date} to {trip.end_date}
+- Home Location: {trip.home_location}
+- Budget Range: {trip.currency} {trip.budget_range[0]:,.0f} to {trip.budget_range[1]:,.0f}"""
+                for i, trip in enumerate(trips, start=1)
+            )
+            
+            prompt = f"""You are a travel research assistant. Provide comprehensive, accurate, and up-to-date information for each leg of a multi-city trip.
+
+For every trip, research: weather_summary (forecast and what to pack), accommodation_suggestions (3-5 stays across price ranges), top_attractions (8-10 places with costs and duration), estimated_daily_cost (in the trip's currency), travel_tips (getting there, local transport, safety, etiquette, food, things to avoid) and best_time_to_visit (is the travel period a good time?).
+
+{trip_blocks}
+
+Return a JSON array with one object per trip, in order. Respond ONLY with valid JSON in this exact format:
+[
+    {{
+        "destination": "...",
+        "weather_summary": "detailed weather info...",
+        "accommodation_suggestions": "hotel recommendations...",
+        "top_attractions": "places to visit...",
+        "estimated_daily_cost": 5000,
+        "currency": "...",
+        "travel_tips": "important tips...",
+        "best_time_to_visit": "timing analysis..."
+    }}
+]"""
+            
+            text = await self._generate(prompt, max_output_tokens=2048 * len(trips))
+            if text is None:
+                raise ValueError("No candidates in Gemini response")
+            
+            research_list = json.loads(strip_code_fence(text))
+            if not isinstance(research_list, list) or len(research_list) != len(trips):
+                raise ValueError(
+                    f"Expected a JSON array of {len(trips)} results from Gemini"
+                )
+            
+            results = [
+                self._to_result(data, trip.destination, trip.currency)
+                for data, trip in zip(research_list, trips)
+            ]
+        
+        except Exception as e:
+            # One bad batch reply should not turn every leg into mock data
+            logger.warning(
+                f"Gemini batch research failed, researching each destination separately: {e}",
+                exc_info=True,
+            )
+            return await self._research_each(trips)
+        
+        logger.info(f"Successfully researched {len(trips)} destinations")
+        return results
+    
+    async def _research_each(self, trips: List[TripQuery]) -> List[ResearchResult]:
+        """Research each trip with its own concurrent research_destination() call."""
+        return list(await asyncio.gather(*(
+            self.research_destination(
+                destination=trip.destination,
+                start_date=trip.start_date,
+                end_date=trip.end_date,
+                home_location=trip.home_location,
+                budget_range=trip.budget_range,
+                currency=trip.currency,
+            )
+            for trip in trips
+        )))
+    
+    async def _generate(self, prompt: str, max_output_tokens: int) -> Optional[str]:
+        """Send a prompt to Gemini and return the first candidate's text, if any."""
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
+        
+        payload = GeminiPayload.from_prompt(
+            prompt,
+            generation_config={
+                "temperature": 0.7,
+                "topK": 40,
+                "topP": 0.95,
+                "maxOutputTokens": max_output_tokens,
+            },
+        )
+        
+        headers = {"Content-Type": "application/json"}
+        
+        response = await self._client.post(
+            url,
+            params={"key": self.api_key},
+            json=payload.to_dict(),
+            headers=headers,
+            timeout=30.0,
+        )
+        
+        response.raise_for_status()
+        result = response.json()
+        
+        # Extract text from Gemini response
+        if "candidates" in result and len(result["candidates"]) > 0:
+            return result["candidates"][0]["content"]["parts"][0]["text"]
+        return None
+    
+    def _to_result(
+        self,
+        research_data: Dict[str, Any],
+        destination: str,
+        currency: str,
+    ) -> ResearchResult:
+        """Build a ResearchResult from one parsed Gemini JSON object."""
+        return ResearchResult(
+            destination=research_data.get("destination", destination),
+            weather_summary=_format_value(research_data.get("weather_summary", "")),
+            accommodation_suggestions=_format_value(research_data.get("accommodation_suggestions", "")),
+            top_attractions=_format_value(research_data.get("top_attractions", "")),
+            estimated_daily_cost=float(research_data.get("estimated_daily_cost", 5000)),
+            currency=research_data.get("currency", currency),
+            travel_tips=_format_value(research_data.get("travel_tips", "")),
+            best_time_to_visit=_format_value(research_data.get("best_time_to_visit", "")),
+        )
+    
     async def _mock_research(self, destination: str, currency: str) -> ResearchResult:
         """Return mock research data when API is unavailable."""
         logger.warning(f"Using mock research data for {destination}")
         
         return ResearchResult(
+            is_mock=True,
             destination=destination,
             weather_summary=f"The weather in {destination} during your travel dates is generally pleasant. Temperatures range from 15-28°C. Pack light cotton clothes, sunscreen, and a light jacket for evenings. Minimal rainfall expected.",
             accommodation_suggestions=f"""Recommended stays in {destination}:
@@ -236,11 +363,27 @@ Respond ONLY with valid JSON in this exact format:
         )
     
     async def close(self):
-        """Close HTTP client."""
-        await self._client.aclose()
+        """
+        Release the client.
+        
+        The shared HTTP client is left open for other callers; use
+        close_http_client() on application shutdown.
+        """
     
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, *args):
         await self.close()
+
+
+# Global research client instance
+_research_client: Optional[GeminiResearchClient] = None
+
+
+def get_gemini_research_client() -> GeminiResearchClient:
+    """Get or create the global Gemini research client."""
+    global _research_client
+    if _research_client is None:
+        _research_client = GeminiResearchClient()
+    return _research_client
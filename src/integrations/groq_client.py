@@ -5,17 +5,31 @@ Provides a thin client for Groq API with typed responses and retry logic.
 Used for semantic search and document store operations.
 """
 
-import asyncio
-from typing import Any, Dict, List, Optional
+import functools
+import gzip
+import json
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from src.config.settings import get_settings
+from src.integrations.semantic_cache import SemanticCache, get_semantic_cache
 from src.logging.json_logger import get_logger
+from src.utils.http import get_http_client
+from src.utils.text import strip_code_fence
 
 logger = get_logger(__name__)
 
+# Request bodies below this size are not worth compressing
+_COMPRESS_MIN_BYTES = 512
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_system_message(system_prompt: str) -> str:
+    """JSON-encode a system message once per distinct system prompt."""
+    return f'{{"role":"system","content":{json.dumps(system_prompt)}}}'
+
 
 class GroqSearchResult(BaseModel):
     """Result from Groq semantic search."""
@@ -44,26 +58,59 @@ class GroqClient:
     Supports Groq's inference API for LLM-based chat completions.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        cache: Optional[SemanticCache] = None,
+        compress_requests: Optional[bool] = None,
+    ) -> None:
         """
         Initialize Groq client.
         
+        Settings are only consulted for arguments that are not provided;
+        cache and compression defaults are resolved on first use.
+        
         Args:
             api_key: Groq API key (uses settings if not provided)
             model: Model to use (defaults to settings.groq_model)
+            cache: Response cache (uses the global cache if LLM response
+                or semantic caching is enabled in settings)
+            compress_requests: Gzip large request bodies (defaults to
+                settings.groq_compress_requests)
         """
-        settings = get_settings()
-        self.api_key = api_key or settings.groq_api_key
-        self.model = model or settings.groq_model
+        self.api_key = api_key if api_key is not None else get_settings().groq_api_key
+        self.model = model if model is not None else get_settings().groq_model
         self.base_url = "https://api.groq.com/openai/v1"
-        
-        self._client = httpx.AsyncClient(
-            timeout=60.0,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            } if self.api_key else {},
-        )
+        self._cache_arg = cache
+        self._compress_arg = compress_requests
+        self._model_json = json.dumps(self.model)
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        } if self.api_key else {}
+    
+    @functools.cached_property
+    def _cache(self) -> Optional[SemanticCache]:
+        """Response cache: the one passed in, else the global cache if enabled in settings."""
+        if self._cache_arg is not None:
+            return self._cache_arg
+        settings = get_settings()
+        if settings.enable_llm_response_cache or settings.enable_llm_semantic_cache:
+            return get_semantic_cache()
+        return None
+    
+    @functools.cached_property
+    def _compress_requests(self) -> bool:
+        """Whether to gzip large request bodies."""
+        if self._compress_arg is not None:
+            return self._compress_arg
+        return get_settings().groq_compress_requests
+    
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """Shared HTTP client (borrowed, not owned)."""
+        return get_http_client()
     
     async def chat(
         self,
@@ -71,6 +118,7 @@ class GroqClient:
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        cache_scope: Hashable = None,
     ) -> str:
         """
         Chat completion using Groq LLM.
@@ -80,38 +128,126 @@ class GroqClient:
             system_prompt: System instructions (optional)
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum response tokens
+            cache_scope: Entities the answer depends on (see chat_stream())
             
         Returns:
             LLM response text
         """
+        chunks = [
+            chunk async for chunk in self.chat_stream(
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                cache_scope=cache_scope,
+            )
+        ]
+        return "".join(chunks)
+    
+    async def chat_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        cache_scope: Hashable = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion from Groq LLM as it is generated.
+        
+        Uses Groq's server-sent events mode so callers can start consuming
+        the response at first-token latency. With caching enabled, calls at
+        temperature 0 are cached if the response parses as JSON; cached
+        responses are yielded as a single chunk.
+        
+        Args:
+            prompt: User prompt/question
+            system_prompt: System instructions (optional)
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum response tokens
+            cache_scope: Entities the answer depends on, e.g. (destination,
+                dates, budget). Similar prompts only share cached answers
+                within the same scope; without one, only exact repeats hit.
+            
+        Yields:
+            Response text fragments
+        """
         if not self.api_key or self.api_key.startswith("placeholder"):
             logger.warning("Groq API key not configured - using stub response")
-            return '{"error": "API key not configured"}'
+            yield '{"error": "API key not configured"}'
+            return
         
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        # Sampled (temperature > 0) calls expect a fresh answer each time,
+        # e.g. when retrying after unusable output, so only greedy calls
+        # are served from or written to the cache
+        cache = self._cache if temperature == 0 else None
+        cache_namespace = (self.model, system_prompt, max_tokens, cache_scope)
+        if cache is not None:
+            cached = cache.lookup(prompt, cache_namespace, semantic=cache_scope is not None)
+            if cached is not None:
+                yield cached
+                return
         
+        body = self._encode_chat_body(prompt, system_prompt, temperature, max_tokens)
+        headers = self._headers
+        if self._compress_requests and len(body) > _COMPRESS_MIN_BYTES:
+            body = gzip.compress(body, mtime=0)
+            headers = {**headers, "Content-Encoding": "gzip"}
+        
+        chunks: List[str] = []
         try:
-            response = await self._client.post(
+            async with self._client.stream(
+                "POST",
                 f"{self.base_url}/chat/completions",
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                }
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            return result["choices"][0]["message"]["content"]
+                headers=headers,
+                content=body,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    delta = json.loads(data)["choices"][0]["delta"].get("content")
+                    if delta:
+                        chunks.append(delta)
+                        yield delta
             
         except Exception as e:
             logger.error(f"Groq chat error: {e}")
             raise
+        
+        text = "".join(chunks)
+        if cache is not None:
+            try:
+                json.loads(strip_code_fence(text))
+            except ValueError:
+                return
+            cache.store(prompt, text, cache_namespace)
+    
+    def _encode_chat_body(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+    ) -> bytes:
+        """
+        Encode a streaming chat completion request body.
+        
+        The model and system message are encoded once and spliced in, so
+        only the user turn is serialized on every call.
+        """
+        # Only the prompt string itself is encoded; no message dicts are built
+        messages = f'{{"role":"user","content":{json.dumps(prompt)}}}'
+        if system_prompt:
+            messages = f"{_encode_system_message(system_prompt)},{messages}"
+        return (
+            f'{{"model":{self._model_json},"messages":[{messages}],'
+            f'"temperature":{json.dumps(temperature)},"max_tokens":{int(max_tokens)},'
+            f'"stream":true}}'
+        ).encode("utf-8")
     
     async def search(
         self,
@@ -156,12 +292,13 @@ class GroqClient:
         try:
             response = await self._client.post(
                 f"{self.base_url}/search",
+                headers=self._headers,
                 json={"query": query, "limit": limit, "filters": filters},
             )
             response.raise_for_status()
-            data = response.json()
-            return GroqSearchResponse(**data)
-        except httpx.HTTPError as e:
+            # Parse and validate the raw bytes in one pass (no intermediate dict)
+            return GroqSearchResponse.model_validate_json(response.content)
+        except (httpx.HTTPError, ValidationError) as e:
             logger.error(f"Groq API error: {e}")
             raise
     
@@ -192,8 +329,12 @@ class GroqClient:
         return True
     
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """
+        Release the client.
+        
+        The shared HTTP client is left open for other callers; use
+        close_http_client() on application shutdown.
+        """
     
     async def __aenter__(self) -> "GroqClient":
         """Async context manager entry."""
@@ -12,15 +12,88 @@ MCP enables standardized tool integration with:
 """
 
 import asyncio
+import functools
+import inspect
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from src.logging.json_logger import get_logger
+from src.config.settings import get_settings
+from src.logging.json_logger import Preview, get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+SchemaValidator = Callable[[Dict[str, Any]], Any]
+
+_JSON_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list, tuple),
+    "object": (dict,),
+}
+
+
+def _compile_basic_validator(schema: Dict[str, Any]) -> SchemaValidator:
+    """
+    Build a validator for the top level of an object schema.
+    
+    Fallback used when fastjsonschema is not installed. Checks required
+    properties, property types and enums; nested schemas are not checked.
+    """
+    required = tuple(schema.get("required", ()))
+    checks = []
+    for name, prop in schema.get("properties", {}).items():
+        types = _JSON_TYPES.get(prop.get("type", ""))
+        enum = prop.get("enum")
+        if types or enum:
+            checks.append((name, types, prop.get("type") in ("integer", "number"), enum))
+    
+    def validate(data: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(data, dict):
+            raise ValueError("data must be object")
+        for name in required:
+            if name not in data:
+                raise ValueError(f"data must contain ['{name}'] properties")
+        for name, types, numeric, enum in checks:
+            if name not in data:
+                continue
+            value = data[name]
+            if types and (not isinstance(value, types) or (numeric and isinstance(value, bool))):
+                raise ValueError(f"data.{name} must be {schema['properties'][name]['type']}")
+            if enum and value not in enum:
+                raise ValueError(f"data.{name} must be one of {enum}")
+        return data
+    
+    return validate
+
+
+def compile_schema(schema: Dict[str, Any]) -> SchemaValidator:
+    """
+    Compile a JSON Schema into a reusable validator callable.
+    
+    Uses fastjsonschema when available. Validators raise ValueError
+    (fastjsonschema's JsonSchemaException subclasses it) on invalid data.
+    
+    Args:
+        schema: JSON Schema dict
+    
+    Returns:
+        Validator callable taking the data to validate
+    """
+    if FASTJSONSCHEMA_AVAILABLE:
+        # use_default=False keeps validation from mutating the arguments
+        return fastjsonschema.compile(schema, use_default=False)
+    return _compile_basic_validator(schema)
+
 
 class MCPToolDefinition(BaseModel):
     """MCP tool definition with schema."""
@@ -34,6 +107,8 @@ class MCPToolDefinition(BaseModel):
         default="general",
         description="Tool category (research, generation, optimization, search, calculation)"
     )
+    
+    _validator: Optional[SchemaValidator] = PrivateAttr(default=None)
 
 
 class MCPToolRequest(BaseModel):
@@ -59,6 +134,32 @@ class MCPToolResponse(BaseModel):
     )
 
 
+# Idempotent tools whose identical concurrent invocations may share one call.
+# Sampled LLM calls and job-starting tools must each run on their own.
+COALESCED_TOOLS = frozenset({"duckduckgo_search", "calculator"})
+
+
+def _build_response(
+    request: MCPToolRequest,
+    result: Any = None,
+    error: Optional[str] = None,
+) -> MCPToolResponse:
+    """
+    Build a response for a request without re-running validation.
+    
+    Every field comes from an already-validated request or from the
+    client itself, so model_construct skips Pydantic's per-call
+    validation on the tool invocation hot path.
+    """
+    return MCPToolResponse.model_construct(
+        tool_name=request.tool_name,
+        result=result,
+        error=error,
+        trace_id=request.trace_id,
+        correlation_id=request.correlation_id,
+    )
+
+
 class MCPClient:
     """
     Unified MCP client for tool integration.
@@ -76,6 +177,13 @@ class MCPClient:
     def __init__(self):
         """Initialize MCP client with tool registry."""
         self.tools_registry: Dict[str, MCPToolDefinition] = {}
+        # In-flight invocations keyed by (tool_name, canonical arguments)
+        self._inflight: Dict[Tuple[str, str], "asyncio.Task[MCPToolResponse]"] = {}
+        # Tool implementation -> whether it is a coroutine function
+        self._async_tools: Dict[Callable[..., Any], bool] = {}
+        # Per-tool concurrency limits, created on first use inside the event loop
+        self.max_concurrent_per_tool = get_settings().mcp_max_concurrent_per_tool
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
         self._register_tools()
         logger.info(f"MCP client initialized with {len(self.tools_registry)} tools")
     
@@ -112,6 +220,37 @@ class MCPClient:
             }
         )
         
+        # Asynchronous variant of the research tool: start a job, then poll it
+        self.tools_registry["gemini_research_start"] = MCPToolDefinition(
+            name="gemini_research_start",
+            description="Start Gemini destination research in the background and return a job_id to poll",
+            category="research",
+            input_schema=self.tools_registry["gemini_research"].input_schema,
+        )
+        
+        self.tools_registry["gemini_research_poll"] = MCPToolDefinition(
+            name="gemini_research_poll",
+            description="Poll a research job started with gemini_research_start for its status and result",
+            category="research",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "Job ID returned by gemini_research_start"
+                    }
+                },
+                "required": ["job_id"]
+            }
+        )
+        
+        self.tools_registry["gemini_research_cancel"] = MCPToolDefinition(
+            name="gemini_research_cancel",
+            description="Cancel a research job started with gemini_research_start",
+            category="research",
+            input_schema=self.tools_registry["gemini_research_poll"].input_schema,
+        )
+        
         # Groq LLM Tool
         self.tools_registry["groq_llm"] = MCPToolDefinition(
             name="groq_llm",
@@ -196,6 +335,10 @@ class MCPClient:
             }
         )
         
+        # Compile input schemas once so per-call validation stays cheap
+        for definition in self.tools_registry.values():
+            definition._validator = compile_schema(definition.input_schema)
+        
         logger.debug(f"Registered {len(self.tools_registry)} MCP tools")
     
     def get_tool_definition(self, tool_name: str) -> Optional[MCPToolDefinition]:
@@ -206,6 +349,41 @@ class MCPClient:
         """List all available MCP tools."""
         return list(self.tools_registry.values())
     
+    async def invoke_tools_batch(
+        self,
+        requests: List[MCPToolRequest],
+        tool_implementations: Dict[str, Any],
+        stop_on_error: bool = False,
+    ) -> List[MCPToolResponse]:
+        """
+        Invoke several MCP tools concurrently.
+        
+        Concurrency is bounded by the per-tool limit. With stop_on_error,
+        calls still waiting for a slot once one call fails are skipped.
+        
+        Args:
+            requests: Tool invocation requests
+            tool_implementations: Dict mapping tool_name -> implementation callable
+            stop_on_error: Skip calls that have not started yet once one fails
+        
+        Returns:
+            Tool responses in the same order as the requests
+        """
+        if not stop_on_error:
+            return list(await asyncio.gather(
+                *(self.invoke_tool(request, tool_implementations) for request in requests)
+            ))
+        
+        failed = asyncio.Event()
+        
+        async def run(request: MCPToolRequest) -> MCPToolResponse:
+            response = await self._execute_tool(request, tool_implementations, abort=failed)
+            if response.error:
+                failed.set()
+            return response
+        
+        return list(await asyncio.gather(*(run(request) for request in requests)))
+    
     async def invoke_tool(
         self,
         request: MCPToolRequest,
@@ -214,6 +392,11 @@ class MCPClient:
         """
         Invoke an MCP tool with error handling and tracing.
         
+        Concurrent invocations of an idempotent tool (see COALESCED_TOOLS)
+        with identical arguments share a single underlying call; each caller
+        still receives its own copy of the response, carrying its own trace
+        and correlation IDs.
+        
         Args:
             request: Tool invocation request
             tool_implementations: Dict mapping tool_name -> implementation callable
@@ -221,15 +404,68 @@ class MCPClient:
         Returns:
             Tool response with result or error
         """
+        if request.tool_name not in COALESCED_TOOLS:
+            return await self._execute_tool(request, tool_implementations)
+        
+        key = (
+            request.tool_name,
+            json.dumps(request.arguments, sort_keys=True, default=str),
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            # The shared call runs in its own task so that cancelling the
+            # first caller does not cancel the others
+            task = asyncio.ensure_future(self._execute_tool(request, tool_implementations))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug(
+                "Coalescing MCP tool invocation",
+                extra={"tool_name": request.tool_name, "trace_id": request.trace_id}
+            )
+        response = await asyncio.shield(task)
+        return response.model_copy(deep=True, update={
+            "trace_id": request.trace_id,
+            "correlation_id": request.correlation_id,
+        })
+    
+    def _semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent calls to a tool."""
+        semaphore = self._semaphores.get(tool_name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_per_tool)
+            self._semaphores[tool_name] = semaphore
+        return semaphore
+    
+    def _is_async_tool(self, tool_fn: Callable[..., Any]) -> bool:
+        """Classify a tool implementation once and remember the answer."""
+        is_async = self._async_tools.get(tool_fn)
+        if is_async is None:
+            is_async = inspect.iscoroutinefunction(tool_fn)
+            self._async_tools[tool_fn] = is_async
+        return is_async
+    
+    async def _execute_tool(
+        self,
+        request: MCPToolRequest,
+        tool_implementations: Dict[str, Any],
+        abort: Optional[asyncio.Event] = None,
+    ) -> MCPToolResponse:
+        """
+        Run a single tool invocation, converting failures into error responses.
+        
+        If abort is set by the time a concurrency slot frees up, the call
+        is skipped instead of run.
+        """
         tool_name = request.tool_name
         
         logger.info(
-            f"MCP tool invocation",
+            "MCP tool invocation",
             extra={
                 "tool_name": tool_name,
                 "trace_id": request.trace_id,
                 "correlation_id": request.correlation_id,
-                "arguments": str(request.arguments)[:100]  # truncate for logging
+                "arguments": Preview(request.arguments),  # rendered only if emitted
             }
         )
         
@@ -238,38 +474,45 @@ class MCPClient:
             if tool_name not in self.tools_registry:
                 error_msg = f"Unknown MCP tool: {tool_name}"
                 logger.error(error_msg)
-                return MCPToolResponse(
-                    tool_name=tool_name,
-                    result=None,
-                    error=error_msg,
-                    trace_id=request.trace_id,
-                    correlation_id=request.correlation_id
-                )
+                return _build_response(request, error=error_msg)
+            
+            # Validate arguments against the precompiled input schema
+            validator = self.tools_registry[tool_name]._validator
+            if validator is not None:
+                try:
+                    validator(request.arguments)
+                except ValueError as e:
+                    error_msg = f"Invalid arguments for MCP tool {tool_name}: {e}"
+                    logger.error(error_msg)
+                    return _build_response(request, error=error_msg)
             
             # Get tool implementation
             if tool_name not in tool_implementations:
                 error_msg = f"No implementation for MCP tool: {tool_name}"
                 logger.error(error_msg)
-                return MCPToolResponse(
-                    tool_name=tool_name,
-                    result=None,
-                    error=error_msg,
-                    trace_id=request.trace_id,
-                    correlation_id=request.correlation_id
-                )
+                return _build_response(request, error=error_msg)
             
-            # Invoke tool
+            # Invoke tool: await async tools directly, run sync tools in a
+            # worker thread so they don't block the event loop
             tool_fn = tool_implementations[tool_name]
-            
-            # Check if the result of calling tool_fn is a coroutine (for async methods)
-            result = tool_fn(**request.arguments)
-            
-            # If it's a coroutine, await it
-            if asyncio.iscoroutine(result):
-                result = await result
+            async with self._semaphore(tool_name):
+                if abort is not None and abort.is_set():
+                    return _build_response(
+                        request, error="Skipped: an earlier call in the batch failed"
+                    )
+                if self._is_async_tool(tool_fn):
+                    result = await tool_fn(**request.arguments)
+                else:
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(
+                        None, functools.partial(tool_fn, **request.arguments)
+                    )
+                    # Callables that hide a coroutine function (e.g. partials)
+                    if asyncio.iscoroutine(result):
+                        result = await result
             
             logger.info(
-                f"MCP tool succeeded",
+                "MCP tool succeeded",
                 extra={
                     "tool_name": tool_name,
                     "trace_id": request.trace_id,
@@ -277,12 +520,7 @@ class MCPClient:
                 }
             )
             
-            return MCPToolResponse(
-                tool_name=tool_name,
-                result=result,
-                trace_id=request.trace_id,
-                correlation_id=request.correlation_id
-            )
+            return _build_response(request, result=result)
         
         except Exception as e:
             error_msg = f"MCP tool invocation failed: {str(e)}"
@@ -294,13 +532,7 @@ class MCPClient:
                     "error": str(e)
                 }
             )
-            return MCPToolResponse(
-                tool_name=tool_name,
-                result=None,
-                error=error_msg,
-                trace_id=request.trace_id,
-                correlation_id=request.correlation_id
-            )
+            return _build_response(request, error=error_msg)
 
 
 # Global MCP client instance
@@ -5,10 +5,14 @@ This module provides adapters that integrate existing tools (Gemini, Groq, DuckD
 with the MCP protocol, enabling standardized tool invocation and response handling.
 """
 
+import asyncio
+import functools
 import json
-from typing import Any, Dict, Optional
+import uuid
+from collections.abc import Mapping
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
 
-from src.integrations.gemini_research import GeminiResearchClient
+from src.integrations.gemini_research import GeminiResearchClient, get_gemini_research_client
 from src.integrations.groq_client import GroqClient
 from src.integrations.duckduckgo_client import DuckDuckGoClient
 from src.integrations.calculator import BudgetCalculator
@@ -23,7 +27,9 @@ class MCPGeminiAdapter:
     
     def __init__(self, client: Optional[GeminiResearchClient] = None):
         """Initialize adapter."""
-        self.client = client or GeminiResearchClient()
+        self.client = client or get_gemini_research_client()
+        # job_id -> running research task (removed once its result is polled)
+        self._jobs: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
     
     async def research(
         self,
@@ -66,8 +72,78 @@ class MCPGeminiAdapter:
             "estimated_daily_cost": result.estimated_daily_cost,
             "currency": result.currency,
             "travel_tips": result.travel_tips,
-            "best_time_to_visit": result.best_time_to_visit
+            "best_time_to_visit": result.best_time_to_visit,
+            "is_mock": result.is_mock,
         }
+    
+    async def start_research(
+        self,
+        destination: str,
+        travel_dates: Optional[Dict[str, str]] = None,
+        interests: Optional[list] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        MCP-compliant tool that starts research in the background.
+        
+        Returns immediately so slow Gemini calls cannot hit client-side
+        MCP timeouts; fetch the result with poll_research().
+        
+        Args:
+            destination: Destination to research
+            travel_dates: Travel date range
+            interests: Travel interests
+            
+        Returns:
+            Dict with the job_id and its status
+        """
+        job_id = uuid.uuid4().hex
+        self._jobs[job_id] = asyncio.create_task(
+            self.research(destination, travel_dates=travel_dates, interests=interests)
+        )
+        return {"job_id": job_id, "status": "running"}
+    
+    async def poll_research(self, job_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        MCP-compliant tool that reports on a research job.
+        
+        Args:
+            job_id: Job ID returned by start_research()
+            
+        Returns:
+            Dict with the job status ("running", "done" or "failed") and,
+            once finished, its result or error
+        """
+        task = self._jobs.get(job_id)
+        if task is None:
+            raise ValueError(f"Unknown research job: {job_id}")
+        if not task.done():
+            return {"job_id": job_id, "status": "running"}
+        
+        del self._jobs[job_id]
+        if task.cancelled():
+            return {"job_id": job_id, "status": "failed", "error": "Research job was cancelled"}
+        error = task.exception()
+        if error is not None:
+            return {"job_id": job_id, "status": "failed", "error": str(error)}
+        return {"job_id": job_id, "status": "done", "result": task.result()}
+    
+    async def cancel_research(self, job_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        MCP-compliant tool that cancels a research job and forgets it.
+        
+        Args:
+            job_id: Job ID returned by start_research()
+            
+        Returns:
+            Dict with the job status ("cancelled", or "unknown" if the job
+            already finished and was collected)
+        """
+        task = self._jobs.pop(job_id, None)
+        if task is None:
+            return {"job_id": job_id, "status": "unknown"}
+        task.cancel()
+        return {"job_id": job_id, "status": "cancelled"}
 
 
 class MCPGroqAdapter:
@@ -100,10 +176,7 @@ class MCPGroqAdapter:
             extra={"json_mode": json_mode, "temperature": temperature}
         )
         
-        if json_mode:
-            result = await self.client.chat(prompt, json_mode=True)
-        else:
-            result = await self.client.chat(prompt)
+        result = await self.client.chat(prompt, temperature=temperature)
         
         return {
             "response": result,
@@ -162,6 +235,12 @@ class MCPCalculatorAdapter:
     def __init__(self, calculator: Optional[BudgetCalculator] = None):
         """Initialize adapter."""
         self.calculator = calculator or BudgetCalculator()
+        self._ops: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+            "total_cost": self._total_cost,
+            "per_day": self._per_day,
+            "convert_currency": self._convert,
+            "budget_check": self._budget_check,
+        }
     
     async def calculate(
         self,
@@ -186,57 +265,135 @@ class MCPCalculatorAdapter:
             Calculation result dict
         """
         logger.info(
-            f"MCP Calculator invoked",
+            "MCP Calculator invoked",
             extra={"operation": operation, "num_days": num_days}
         )
         
-        if operation == "total_cost" and amounts:
-            result = sum(amounts)
-            return {"operation": operation, "result": result}
-        
-        elif operation == "per_day" and amounts and num_days:
-            total = sum(amounts)
-            per_day = total / num_days if num_days > 0 else 0
-            return {"operation": operation, "total": total, "per_day": per_day, "days": num_days}
-        
-        elif operation == "convert_currency" and amounts and from_currency and to_currency:
-            # Placeholder conversion (would use real rates)
-            converted = amounts[0] * 1.0  # Same rate for demo
-            return {
-                "operation": operation,
-                "amount": amounts[0],
-                "from_currency": from_currency,
-                "to_currency": to_currency,
-                "converted_amount": converted
-            }
-        
-        elif operation == "budget_check" and amounts and from_currency:
-            total = sum(amounts)
-            return {
-                "operation": operation,
-                "total_spent": total,
-                "currency": from_currency
-            }
-        
-        else:
+        handler = self._ops.get(operation)
+        if handler is None:
             raise ValueError(f"Invalid calculator operation: {operation}")
+        return await handler(
+            amounts=amounts,
+            from_currency=from_currency,
+            to_currency=to_currency,
+            num_days=num_days,
+        )
+    
+    async def _total_cost(self, amounts: Optional[list] = None, **kwargs) -> Dict[str, Any]:
+        """Sum the amounts."""
+        if not amounts:
+            raise ValueError("total_cost requires amounts")
+        return {"operation": "total_cost", "result": sum(amounts)}
+    
+    async def _per_day(
+        self,
+        amounts: Optional[list] = None,
+        num_days: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Spread the summed amounts over num_days."""
+        if not amounts:
+            raise ValueError("per_day requires amounts")
+        if not num_days:
+            raise ValueError("per_day requires a non-zero num_days")
+        total = sum(amounts)
+        per_day = total / num_days if num_days > 0 else 0
+        return {"operation": "per_day", "total": total, "per_day": per_day, "days": num_days}
+    
+    async def _convert(
+        self,
+        amounts: Optional[list] = None,
+        from_currency: Optional[str] = None,
+        to_currency: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Convert every amount with one (cached) exchange rate lookup."""
+        if not (amounts and from_currency and to_currency):
+            raise ValueError("convert_currency requires amounts, from_currency and to_currency")
+        rate_info = await self.calculator.get_exchange_rate(from_currency, to_currency)
+        rate = float(rate_info.rate)
+        converted_amounts = [amount * rate for amount in amounts]
+        return {
+            "operation": "convert_currency",
+            "amount": amounts[0],
+            "from_currency": from_currency,
+            "to_currency": to_currency,
+            "converted_amount": converted_amounts[0],
+            "converted_amounts": converted_amounts,
+            "rate": rate,
+        }
+    
+    async def _budget_check(
+        self,
+        amounts: Optional[list] = None,
+        from_currency: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Report the total spent in from_currency."""
+        if not (amounts and from_currency):
+            raise ValueError("budget_check requires amounts and from_currency")
+        return {
+            "operation": "budget_check",
+            "total_spent": sum(amounts),
+            "currency": from_currency
+        }
+
+
+class LazyToolAdapters(Mapping):
+    """
+    Read-only tool registry that builds each adapter on first access.
+    
+    Adapters open their own HTTP clients, so a run that only uses one
+    tool should not pay for constructing the others.
+    """
+    
+    def __init__(self, factories: Dict[str, Callable[[], Any]]) -> None:
+        """
+        Initialize the registry.
+        
+        Args:
+            factories: Dict mapping tool_name -> zero-argument factory
+        """
+        self._factories = factories
+        self._adapters: Dict[str, Any] = {}
+    
+    def __getitem__(self, tool_name: str) -> Any:
+        adapter = self._adapters.get(tool_name)
+        if adapter is None:
+            adapter = self._factories[tool_name]()
+            self._adapters[tool_name] = adapter
+            logger.info("MCP tool adapter initialized", extra={"tool_name": tool_name})
+        return adapter
+    
+    def __contains__(self, tool_name: object) -> bool:
+        return tool_name in self._factories
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+    
+    def __len__(self) -> int:
+        return len(self._factories)
 
 
 # Global tool adapters registry
-_tool_adapters: Dict[str, Any] = {}
+_tool_adapters: Optional[LazyToolAdapters] = None
 
 
-def get_tool_adapters() -> Dict[str, Any]:
-    """Get or initialize tool adapters."""
+def get_tool_adapters() -> LazyToolAdapters:
+    """Get or initialize tool adapters (each adapter is created on first use)."""
     global _tool_adapters
-    if not _tool_adapters:
-        _tool_adapters = {
-            "gemini_research": MCPGeminiAdapter().research,
-            "groq_llm": MCPGroqAdapter().generate,
-            "duckduckgo_search": MCPDuckDuckGoAdapter().search,
-            "calculator": MCPCalculatorAdapter().calculate
-        }
-        logger.info("MCP tool adapters initialized", extra={"count": len(_tool_adapters)})
+    if _tool_adapters is None:
+        # The research tools share one adapter so polls can see started jobs
+        gemini_adapter = functools.lru_cache(maxsize=None)(MCPGeminiAdapter)
+        _tool_adapters = LazyToolAdapters({
+            "gemini_research": lambda: gemini_adapter().research,
+            "gemini_research_start": lambda: gemini_adapter().start_research,
+            "gemini_research_poll": lambda: gemini_adapter().poll_research,
+            "gemini_research_cancel": lambda: gemini_adapter().cancel_research,
+            "groq_llm": lambda: MCPGroqAdapter().generate,
+            "duckduckgo_search": lambda: MCPDuckDuckGoAdapter().search,
+            "calculator": lambda: MCPCalculatorAdapter().calculate,
+        })
     return _tool_adapters
 
 
@@ -269,3 +426,35 @@ async def invoke_mcp_tool(
     
     tool_adapters = get_tool_adapters()
     return await mcp_client.invoke_tool(request, tool_adapters)
+
+
+async def invoke_mcp_tools_batch(
+    calls: List[Dict[str, Any]],
+    trace_id: str,
+    correlation_id: str,
+    stop_on_error: bool = False,
+) -> List[MCPToolResponse]:
+    """
+    Invoke several independent MCP tools concurrently.
+    
+    Args:
+        calls: List of {"tool_name": ..., "arguments": {...}} dicts
+        trace_id: Trace ID for tracking
+        correlation_id: Correlation ID for tracking
+        stop_on_error: Skip calls that have not started yet once one fails
+        
+    Returns:
+        Tool responses in the same order as calls
+    """
+    requests = [
+        MCPToolRequest(
+            tool_name=call["tool_name"],
+            arguments=call.get("arguments", {}),
+            trace_id=trace_id,
+            correlation_id=correlation_id
+        )
+        for call in calls
+    ]
+    return await get_mcp_client().invoke_tools_batch(
+        requests, get_tool_adapters(), stop_on_error=stop_on_error
+    )
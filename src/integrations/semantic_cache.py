@@ -0,0 +1,291 @@
+"""
+Semantic response cache for LLM chat completions.
+
+Stores LLM responses so that repeated prompts can be answered locally
+instead of paying a full API round trip. Lookups go through two tiers:
+an exact-match dict lookup on the prompt, then (optionally) a semantic
+tier that embeds the prompt and compares it to cached prompt embeddings.
+"""
+
+import math
+import re
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.config.settings import get_settings
+from src.logging.json_logger import get_logger
+
+logger = get_logger(__name__)
+
+Embedding = List[float]
+EmbedFn = Callable[[str], Embedding]
+EmbedBatchFn = Callable[[List[str]], List[Embedding]]
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def hashed_embedding(text: str, dim: int = 256) -> Embedding:
+    """
+    Embed text as an L2-normalized hashed bag of word unigrams and bigrams.
+
+    A dependency-free default for SemanticCache. It matches reworded prompts
+    that share most of their vocabulary; pass a model-backed embedder
+    (e.g. sentence-transformers) to SemanticCache for true paraphrase matching.
+
+    Args:
+        text: Text to embed
+        dim: Embedding dimensionality
+
+    Returns:
+        Unit-length embedding vector
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    vector = [0.0] * dim
+    for i, token in enumerate(tokens):
+        vector[zlib.crc32(token.encode("utf-8")) % dim] += 1.0
+        if i:
+            bigram = f"{tokens[i - 1]} {token}"
+            vector[zlib.crc32(bigram.encode("utf-8")) % dim] += 1.0
+
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0.0:
+        return vector
+    return [v / norm for v in vector]
+
+
+def cosine_similarity(a: Embedding, b: Embedding) -> float:
+    """Cosine similarity of two embeddings."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def _normalize(vector: Embedding) -> Embedding:
+    """Scale an embedding to unit length so cosine similarity is a dot product."""
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector] if norm else list(vector)
+
+
+@dataclass
+class _CacheEntry:
+    """A cached response with its (unit-length) prompt embedding."""
+
+    embedding: Embedding
+    response: str
+    expires_at: float
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache for LLM responses.
+
+    Entries are partitioned by a namespace (model, system prompt, max
+    tokens and the caller's cache scope) so that requests for different
+    trips or settings never share answers. Within a namespace, an identical prompt is served
+    straight from a dict without computing any embedding; otherwise, when
+    semantic matching is enabled, a lookup returns the most similar cached
+    response whose cosine similarity reaches the threshold. Entries expire
+    after a TTL and the least recently used entries are evicted once the
+    cache is full.
+
+    Prompt embeddings are themselves memoized in a small TTL'd LRU, so a
+    prompt that misses and is then stored is only embedded once, and
+    embed_batch() lets a provider-backed embedder serve many prompts in a
+    single call.
+    """
+
+    def __init__(
+        self,
+        embed: Optional[EmbedFn] = None,
+        semantic: bool = True,
+        threshold: float = 0.92,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+        embed_batch: Optional[EmbedBatchFn] = None,
+        embedding_cache_size: int = 1000,
+        embedding_ttl_seconds: float = 3600,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            embed: Function mapping text to an embedding (defaults to hashed_embedding)
+            semantic: Match similar prompts; if False only exact repeats hit
+            threshold: Minimum cosine similarity for a cache hit
+            ttl_seconds: Time-to-live for cached responses
+            max_entries: Maximum number of cached responses (LRU eviction)
+            clock: Time source, overridable for testing
+            embed_batch: Function embedding many texts in one call
+                (defaults to calling embed per text)
+            embedding_cache_size: Maximum number of memoized prompt embeddings
+            embedding_ttl_seconds: Time-to-live for memoized prompt embeddings
+        """
+        self._embed = embed or hashed_embedding
+        self._embed_many = embed_batch or (lambda texts: [self._embed(t) for t in texts])
+        self.embedding_cache_size = embedding_cache_size
+        self.embedding_ttl_seconds = embedding_ttl_seconds
+        # text -> (unit-length embedding, expires_at), in LRU order
+        self._embeddings: "OrderedDict[str, Tuple[Embedding, float]]" = OrderedDict()
+        self.semantic = semantic
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        # LRU order across all namespaces: (namespace, prompt) -> entry
+        self._entries: "OrderedDict[Tuple[Hashable, str], _CacheEntry]" = OrderedDict()
+        self._by_namespace: Dict[Hashable, Dict[str, _CacheEntry]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def embed_batch(self, texts: List[str]) -> List[Embedding]:
+        """
+        Embed several texts, computing only those not already memoized.
+
+        Misses are embedded in a single embed_batch call and memoized.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Unit-length embeddings in the same order as texts
+        """
+        now = self._clock()
+        found: Dict[str, Embedding] = {}
+        for text in texts:
+            cached = self._embeddings.get(text)
+            if cached is not None and cached[1] > now:
+                self._embeddings.move_to_end(text)
+                found[text] = cached[0]
+
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            expires_at = now + self.embedding_ttl_seconds
+            for text, vector in zip(missing, self._embed_many(missing)):
+                found[text] = _normalize(vector)
+                self._embeddings[text] = (found[text], expires_at)
+                self._embeddings.move_to_end(text)
+            while len(self._embeddings) > self.embedding_cache_size:
+                self._embeddings.popitem(last=False)
+
+        return [found[text] for text in texts]
+
+    def _embedding(self, text: str) -> Embedding:
+        """Unit-length embedding of a single text, via the memo."""
+        return self.embed_batch([text])[0]
+
+    def lookup(
+        self,
+        prompt: str,
+        namespace: Hashable = None,
+        semantic: bool = True,
+    ) -> Optional[str]:
+        """
+        Find a cached response for a semantically similar prompt.
+
+        Bag-of-words similarity cannot tell prompts apart that differ only
+        in a few entities (a destination, dates, a budget), so callers
+        should put those in the namespace or pass semantic=False.
+
+        Args:
+            prompt: Prompt text
+            namespace: Partition key the prompt must match exactly
+            semantic: Fall back to the semantic tier on an exact miss
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        candidates = self._by_namespace.get(namespace)
+        if not candidates:
+            return None
+
+        now = self._clock()
+
+        # Exact tier: identical prompt, no embedding needed
+        entry = candidates.get(prompt)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._entries.move_to_end((namespace, prompt))
+                return entry.response
+            self._remove(namespace, prompt)
+
+        if not (self.semantic and semantic):
+            return None
+
+        # Semantic tier: embeddings are unit length, so cosine is a dot product
+        query = self._embedding(prompt)
+        best_prompt: Optional[str] = None
+        best_score = self.threshold
+
+        for cached_prompt, entry in list(candidates.items()):
+            if entry.expires_at <= now:
+                self._remove(namespace, cached_prompt)
+                continue
+            score = sum(x * y for x, y in zip(query, entry.embedding))
+            if score >= best_score:
+                best_prompt, best_score = cached_prompt, score
+
+        if best_prompt is None:
+            return None
+
+        self._entries.move_to_end((namespace, best_prompt))
+        logger.debug(f"Semantic cache hit (similarity={best_score:.3f})")
+        return candidates[best_prompt].response
+
+    def store(self, prompt: str, response: str, namespace: Hashable = None) -> None:
+        """
+        Cache a response for a prompt.
+
+        Args:
+            prompt: Prompt text
+            response: Response to cache
+            namespace: Partition key for the prompt
+        """
+        entry = _CacheEntry(
+            embedding=self._embedding(prompt) if self.semantic else [],
+            response=response,
+            expires_at=self._clock() + self.ttl_seconds,
+        )
+        key = (namespace, prompt)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._by_namespace.setdefault(namespace, {})[prompt] = entry
+
+        while len(self._entries) > self.max_entries:
+            (old_namespace, old_prompt), _ = next(iter(self._entries.items()))
+            self._remove(old_namespace, old_prompt)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+        self._by_namespace.clear()
+        self._embeddings.clear()
+
+    def _remove(self, namespace: Hashable, prompt: str) -> None:
+        """Remove a single entry from both indexes."""
+        self._entries.pop((namespace, prompt), None)
+        bucket = self._by_namespace.get(namespace)
+        if bucket is not None:
+            bucket.pop(prompt, None)
+            if not bucket:
+                del self._by_namespace[namespace]
+
+
+# Global semantic cache instance
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get or create the global semantic cache instance."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        settings = get_settings()
+        _semantic_cache = SemanticCache(
+            semantic=settings.enable_llm_semantic_cache,
+            threshold=settings.llm_cache_similarity_threshold,
+        )
+    return _semantic_cache
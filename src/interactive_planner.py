@@ -6,28 +6,169 @@ personalized travel itineraries with real-time weather and location research.
 """
 
 import asyncio
+import functools
+import hashlib
 import json
+import os
 import sys
+import threading
+import time
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pydantic import ValidationError as PydanticValidationError
 
-from src.agents.adk_agent.agent import ADKAgent
-from src.agents.crewai_agent.agent import CrewAIAgent
 from src.callbacks.logger_adapter import create_monitoring_listener
 from src.config.settings import get_settings
-from src.integrations.gemini_research import GeminiResearchClient
-from src.integrations.mcp_tool_adapter import invoke_mcp_tool, get_tool_adapters
-from src.integrations.mcp_client import get_mcp_client
-import uuid
+from src.integrations.gemini_research import get_gemini_research_client
+from src.integrations.mcp_tool_adapter import invoke_mcp_tool
+from src.integrations.mcp_client import MCPToolResponse
 from src.logging.json_logger import get_logger
 from src.models.itinerary import TaskContext, TravelerPreferences, TravelerProfile
+from src.utils.http import close_http_client
+from src.utils.runtime import install_uvloop
 from src.workflows.dynamic_planner import DynamicPlannerWorkflow
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.patch_stdout import patch_stdout
+    from prompt_toolkit.validation import ValidationError, Validator
+    PROMPT_TOOLKIT_AVAILABLE = True
+except ImportError:
+    PROMPT_TOOLKIT_AVAILABLE = False
+
+_session: Optional["PromptSession"] = None
+
+if PROMPT_TOOLKIT_AVAILABLE:
+    class _CheckValidator(Validator):
+        """Adapts a get_user_input check function to prompt_toolkit."""
+        
+        def __init__(self, check: Callable[[str], Optional[str]], resolve: Callable[[str], str]) -> None:
+            self._check = check
+            self._resolve = resolve
+        
+        def validate(self, document) -> None:
+            error = self._check(self._resolve(document.text))
+            if error is not None:
+                raise ValidationError(message=error, cursor_position=len(document.text))
+
+RESEARCH_CACHE_DIR = Path(".cache") / "research"
+RESEARCH_CACHE_TTL_SECONDS = 24 * 3600
+DEFAULT_RESEARCH_INTERESTS = ["travel", "culture"]
+RESEARCH_POLL_INITIAL_DELAY = 0.5
+RESEARCH_POLL_MAX_DELAY = 4.0
+RESEARCH_POLL_TIMEOUT_SECONDS = 120.0
+
+RESEARCH_MARKDOWN_TEMPLATE = """\
+# Travel Research: {destination}
+
+**Research Date:** {research_date}
+**Destination:** {destination}
+**Travel Dates:** {start} to {end}
+**Budget:** {budget}
+
+---
+
+## 🌤️ Weather Information
+
+{weather}
+
+## 🏨 Accommodation Suggestions
+
+{accommodation}
+
+## 🎭 Top Attractions
+
+{attractions}
+
+## 💰 Estimated Daily Cost
+
+{daily_cost} per day
+
+## 💡 Travel Tips
+
+{travel_tips}
+
+## 📅 Best Time to Visit
+
+{best_time}
+
+"""
+
+# field name -> (prompt, default, inline check)
+PromptSpec = Tuple[str, Optional[str], Optional[Callable[[str], Optional[str]]]]
+TripModel = TypeVar("TripModel", bound=BaseModel)
+
+
+class CliTripBasics(BaseModel):
+    """Trip details needed before destination research can start."""
+    
+    destination: str = Field(min_length=1, description="Destination city/location")
+    start_date: date = Field(description="Trip start date")
+    end_date: date = Field(description="Trip end date")
+    currency: str = Field(description="ISO 4217 currency code")
+    
+    @field_validator("destination", mode="before")
+    @classmethod
+    def strip_destination(cls, v: Any) -> Any:
+        """Ignore surrounding whitespace."""
+        return v.strip() if isinstance(v, str) else v
+    
+    @field_validator("currency")
+    @classmethod
+    def validate_currency(cls, v: str) -> str:
+        """Normalize to an upper-case three-letter ISO 4217 code."""
+        code = v.strip().upper()
+        if len(code) != 3 or not code.isalpha():
+            raise ValueError("must be a 3-letter ISO 4217 code (e.g., INR, USD, EUR)")
+        return code
+    
+    @field_validator("end_date")
+    @classmethod
+    def validate_end_date(cls, v: date, info: ValidationInfo) -> date:
+        """Ensure the trip does not end before it starts."""
+        start = info.data.get("start_date")
+        if start is not None and v < start:
+            raise ValueError("must not be before the start date")
+        return v
+
+
+class CliTripRequest(CliTripBasics):
+    """Complete, validated trip request collected by the CLI."""
+    
+    budget_min: float = Field(ge=0, description="Minimum budget")
+    budget_max: float = Field(ge=0, description="Maximum budget")
+    interests: List[str] = Field(min_length=1, description="Travel interests")
+    
+    @field_validator("budget_max")
+    @classmethod
+    def validate_budget_max(cls, v: float, info: ValidationInfo) -> float:
+        """Ensure the budget range is ordered."""
+        budget_min = info.data.get("budget_min")
+        if budget_min is not None and v < budget_min:
+            raise ValueError("must be at least the minimum budget")
+        return v
+    
+    @field_validator("interests", mode="before")
+    @classmethod
+    def split_interests(cls, v: Any) -> Any:
+        """Accept a comma-separated string and drop empty entries."""
+        if isinstance(v, str):
+            v = v.split(",")
+        return [i.strip() for i in v if i.strip()] if isinstance(v, list) else v
+
 
 def print_banner():
     """Print welcome banner."""
@@ -36,72 +177,270 @@ def print_banner():
     print("=" * 80 + "\n")
 
 
-def get_user_input(prompt: str, default: Optional[str] = None) -> str:
-    """Get input from user with optional default."""
+async def read_line(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    input() runs on a daemon thread so background tasks (e.g. destination
+    research) keep making progress while the user types, and a pending
+    read never holds up interpreter shutdown after Ctrl+C.
+    """
+    loop = asyncio.get_running_loop()
+    future: "asyncio.Future[str]" = loop.create_future()
+    
+    def settle(value: Optional[str], error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+    
+    def read() -> None:
+        try:
+            value = input(prompt)
+        except BaseException as e:  # EOFError, KeyboardInterrupt
+            loop.call_soon_threadsafe(settle, None, e)
+        else:
+            loop.call_soon_threadsafe(settle, value, None)
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+def _prompt_session() -> "PromptSession":
+    """Get or create the shared prompt_toolkit session."""
+    global _session
+    if _session is None:
+        _session = PromptSession()
+    return _session
+
+
+async def get_user_input(
+    prompt: str,
+    default: Optional[str] = None,
+    check: Optional[Callable[[str], Optional[str]]] = None,
+) -> str:
+    """
+    Get input from user with optional default.
+    
+    Args:
+        prompt: Prompt text
+        default: Value used when the user just presses Enter
+        check: Returns an error message for an invalid value, or None
+        
+    Returns:
+        The entered (or default) value, which passes check
+    """
     if default:
         prompt = f"{prompt} [{default}]: "
     else:
         prompt = f"{prompt}: "
     
-    value = input(prompt).strip()
-    return value if value else (default or "")
+    def resolve(text: str) -> str:
+        value = text.strip()
+        return value if value else (default or "")
+    
+    if PROMPT_TOOLKIT_AVAILABLE and sys.stdin.isatty():
+        # Invalid input is rejected inline, without re-prompting
+        validator = _CheckValidator(check, resolve) if check is not None else None
+        with patch_stdout():
+            return resolve(await _prompt_session().prompt_async(prompt, validator=validator))
+    
+    while True:
+        value = resolve(await read_line(prompt))
+        error = check(value) if check is not None else None
+        if error is None:
+            return value
+        print(f"❌ {error}")
+
+
+def _check_date(value: str) -> Optional[str]:
+    """Validate a YYYY-MM-DD date."""
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return "Invalid date format. Please use YYYY-MM-DD (e.g., 2025-12-15)"
+    return None
+
+
+def _check_number(value: str) -> Optional[str]:
+    """Validate a number."""
+    try:
+        float(value)
+    except ValueError:
+        return "Please enter a valid number"
+    return None
 
 
-def get_date_input(prompt: str) -> datetime:
-    """Get date input from user."""
+async def collect_validated(
+    model: Type[TripModel],
+    fields: Dict[str, PromptSpec],
+    raw: Dict[str, Any],
+) -> TripModel:
+    """
+    Prompt for fields and validate them together with a Pydantic model.
+    
+    Inline checks only catch malformed values; cross-field rules live on
+    the model. All errors are reported at once and only the invalid
+    fields are asked for again.
+    
+    Args:
+        model: Model to validate the collected values with
+        fields: Field name -> (prompt, default, inline check), in prompt order
+        raw: Values collected so far (fields already present are not
+            prompted for unless invalid); updated in place
+        
+    Returns:
+        Validated model instance
+    """
+    pending = [name for name in fields if name not in raw]
     while True:
-        date_str = get_user_input(prompt, "YYYY-MM-DD")
+        for name in pending:
+            prompt, default, check = fields[name]
+            raw[name] = await get_user_input(prompt, default, check=check)
         try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            print("❌ Invalid date format. Please use YYYY-MM-DD (e.g., 2025-12-15)")
+            return model.model_validate(raw)
+        except PydanticValidationError as e:
+            errors = e.errors()
+        
+        print("❌ Please correct the following:")
+        invalid = set()
+        for error in errors:
+            name = error["loc"][0] if error["loc"] else None
+            invalid.add(name)
+            label = fields[name][0] if name in fields else str(name)
+            message = error["msg"].replace("Value error, ", "", 1)
+            print(f"   - {label}: {message}")
+        pending = [name for name in fields if name in invalid] or list(fields)
+
+
+def _ids(n: int) -> List[str]:
+    """Generate n random hex IDs for tracing (not for security use)."""
+    return [uuid.uuid4().hex for _ in range(n)]
+
+
+def _research_cache_key(destination: str, start_date: datetime, end_date: datetime, interests: List[str]) -> str:
+    """Build a short stable key for a research request."""
+    normalized = json.dumps([
+        destination.strip().lower(),
+        start_date.strftime("%Y-%m-%d"),
+        end_date.strftime("%Y-%m-%d"),
+        sorted(i.strip().lower() for i in interests),
+    ])
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _load_cached_research(key: str) -> Optional[dict]:
+    """Return cached research for a key, or None if missing or expired."""
+    path = RESEARCH_CACHE_DIR / f"{key}.json"
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if entry.get("expires_at", 0) <= time.time():
+        return None
+    return entry.get("data")
+
+
+def _store_cached_research(key: str, data: dict) -> None:
+    """Write research to the cache atomically."""
+    try:
+        RESEARCH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = RESEARCH_CACHE_DIR / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        entry = {"expires_at": time.time() + RESEARCH_CACHE_TTL_SECONDS, "data": data}
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not cache research results: {e}")
 
 
-def get_number_input(prompt: str, min_val: Optional[float] = None, max_val: Optional[float] = None) -> float:
-    """Get numeric input from user."""
+async def _await_research_job(job_id: str, trace_id: str, correlation_id: str) -> MCPToolResponse:
+    """
+    Poll a gemini_research_start job with exponential backoff until it finishes.
+    
+    Sleeping between polls keeps the event loop free (and Ctrl-C
+    responsive) while Gemini works. A job still running at the timeout
+    is cancelled.
+    
+    Returns:
+        Tool response whose result is the research dict, or an error
+    """
+    delay = RESEARCH_POLL_INITIAL_DELAY
+    deadline = time.monotonic() + RESEARCH_POLL_TIMEOUT_SECONDS
     while True:
-        try:
-            value = float(get_user_input(prompt))
-            if min_val is not None and value < min_val:
-                print(f"❌ Value must be at least {min_val}")
-                continue
-            if max_val is not None and value > max_val:
-                print(f"❌ Value must be at most {max_val}")
-                continue
-            return value
-        except ValueError:
-            print("❌ Please enter a valid number")
+        await asyncio.sleep(delay)
+        response = await invoke_mcp_tool(
+            "gemini_research_poll", {"job_id": job_id}, trace_id, correlation_id
+        )
+        if response.error:
+            return response
+        status = response.result.get("status")
+        if status == "done":
+            return response.model_copy(update={"result": response.result["result"]})
+        if status == "failed":
+            return response.model_copy(update={"result": None, "error": response.result.get("error")})
+        if time.monotonic() >= deadline:
+            # Stop the abandoned job so it does not linger in the adapter
+            await invoke_mcp_tool(
+                "gemini_research_cancel", {"job_id": job_id}, trace_id, correlation_id
+            )
+            return response.model_copy(update={"result": None, "error": "Research job timed out"})
+        delay = min(delay * 2, RESEARCH_POLL_MAX_DELAY)
 
 
-async def search_destination_info(destination: str, start_date: datetime, end_date: datetime, home_location: str, budget_range: tuple, currency: str) -> dict:
-    """Search for destination weather and travel information using Gemini via MCP."""
-    print(f"\n🔍 Researching {destination} with Gemini 2.0 Flash (via MCP)...")
+async def search_destination_info(
+    destination: str,
+    start_date: datetime,
+    end_date: datetime,
+    home_location: str,
+    budget_range: tuple,
+    currency: str,
+    interests: Optional[List[str]] = None,
+    trace_id: Optional[str] = None,
+    correlation_id: Optional[str] = None,
+) -> dict:
+    """
+    Search for destination weather and travel information using Gemini via MCP.
+    
+    Runs as a background task while the user answers the remaining
+    prompts, so it only prints when something goes wrong.
+    """
+    interests = interests or DEFAULT_RESEARCH_INTERESTS
+    cache_key = _research_cache_key(destination, start_date, end_date, interests)
+    cached = _load_cached_research(cache_key)
+    if cached is not None:
+        return cached
     
-    # Generate trace and correlation IDs for MCP tracking
-    trace_id = str(uuid.uuid4())
-    correlation_id = str(uuid.uuid4())
+    # Reuse the caller's trace and correlation IDs for MCP tracking
+    if trace_id is None or correlation_id is None:
+        trace_id, correlation_id = _ids(2)
     
     try:
-        # Invoke Gemini research tool via MCP protocol
+        # Start research via MCP; the job is polled below so slow Gemini
+        # calls cannot hit MCP timeouts
         response = await invoke_mcp_tool(
-            tool_name="gemini_research",
-            arguments={
+            "gemini_research_start",
+            {
                 "destination": destination,
                 "travel_dates": {
                     "start_date": start_date.strftime("%Y-%m-%d"),
                     "end_date": end_date.strftime("%Y-%m-%d")
                 },
-                "interests": ["travel", "culture"]
+                "interests": interests
             },
-            trace_id=trace_id,
-            correlation_id=correlation_id
+            trace_id,
+            correlation_id
         )
+        if not response.error:
+            response = await _await_research_job(response.result["job_id"], trace_id, correlation_id)
         
         if response.error:
             print(f"   ⚠️ MCP research encountered an issue: {response.error}")
             print(f"   Falling back to direct Gemini client...")
             # Fallback to direct client
-            gemini = GeminiResearchClient()
+            gemini = get_gemini_research_client()
             research = await gemini.research_destination(
                 destination=destination,
                 start_date=start_date.strftime("%Y-%m-%d"),
@@ -114,11 +453,10 @@ async def search_destination_info(destination: str, start_date: datetime, end_da
             # response.result is already the dict from MCPGeminiAdapter
             research = response.result
         
-        print(f"   ✅ Research completed successfully!\n")
-        
         # Extract research data (MCP response or fallback)
         if isinstance(research, dict):
-            return {
+            is_mock = research.get("is_mock", False)
+            info = {
                 "weather": research.get("weather_summary", ""),
                 "accommodation": research.get("accommodation_suggestions", ""),
                 "attractions": research.get("top_attractions", ""),
@@ -128,7 +466,8 @@ async def search_destination_info(destination: str, start_date: datetime, end_da
             }
         else:
             # If Pydantic model (from fallback)
-            return {
+            is_mock = research.is_mock
+            info = {
                 "weather": research.weather_summary,
                 "accommodation": research.accommodation_suggestions,
                 "attractions": research.top_attractions,
@@ -137,6 +476,10 @@ async def search_destination_info(destination: str, start_date: datetime, end_da
                 "best_time": research.best_time_to_visit,
             }
         
+        if not is_mock:
+            _store_cached_research(cache_key, info)
+        return info
+        
     except Exception as e:
         print(f"   ⚠️ Research failed: {e}")
         # Return empty research data to continue workflow
@@ -150,6 +493,51 @@ async def search_destination_info(destination: str, start_date: datetime, end_da
         }
 
 
+async def write_text_file(path: Path, content: Union[str, bytes]) -> None:
+    """Write a UTF-8 text file (or pre-encoded bytes) in a worker thread."""
+    if isinstance(content, bytes):
+        await asyncio.to_thread(path.write_bytes, content)
+    else:
+        await asyncio.to_thread(path.write_text, content, encoding="utf-8")
+
+
+def _write_lines(path: Path, lines: Iterable[str]) -> None:
+    """Write each line followed by a newline."""
+    with path.open("w", encoding="utf-8") as f:
+        f.writelines(line + "\n" for line in lines)
+
+
+async def write_lines_file(path: Path, lines: Iterable[str]) -> None:
+    """Write lines to a UTF-8 text file in a worker thread without joining them first."""
+    await asyncio.to_thread(_write_lines, path, lines)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_attractions_json(raw: str) -> tuple:
+    """Parse a JSON attractions string into a tuple of dicts (empty on bad input)."""
+    try:
+        parsed = json.loads(raw)
+    except (TypeError, ValueError):
+        return ()
+    if not isinstance(parsed, list):
+        return ()
+    return tuple(a for a in parsed if isinstance(a, dict))
+
+
+def parse_attractions(raw: Union[str, list, None]) -> List[dict]:
+    """
+    Parse research attractions into a list of dicts.
+    
+    Attractions may arrive as a JSON string or an already-parsed list;
+    strings are parsed once and memoized so repeated renders reuse them.
+    """
+    if isinstance(raw, list):
+        return [a for a in raw if isinstance(a, dict)]
+    if isinstance(raw, str) and raw:
+        return list(_parse_attractions_json(raw))
+    return []
+
+
 def display_search_results(info: dict):
     """Display search results to user."""
     print("\n" + "=" * 80)
@@ -192,45 +580,67 @@ async def interactive_planning():
     # Collect traveler information
     print("👤 TRAVELER INFORMATION")
     print("-" * 40)
-    name = get_user_input("Your name", "Traveler")
-    email = get_user_input("Your email (optional)")
-    home_location = get_user_input("Your home city", "Mumbai")
+    name = await get_user_input("Your name", "Traveler")
+    email = await get_user_input("Your email (optional)")
+    home_location = await get_user_input("Your home city", "Mumbai")
     
     # Collect trip details
     print("\n✈️  TRIP DETAILS")
     print("-" * 40)
-    destination = get_user_input("Where do you want to go?", "Goa")
+    raw: Dict[str, Any] = {}
+    basics = await collect_validated(CliTripBasics, {
+        "destination": ("Where do you want to go?", "Goa", None),
+        "start_date": ("Start date", "YYYY-MM-DD", _check_date),
+        "end_date": ("End date", "YYYY-MM-DD", _check_date),
+        "currency": ("Currency", "INR", None),
+    }, raw)
+    destination = basics.destination
+    start_date = datetime.combine(basics.start_date, datetime.min.time())
+    end_date = datetime.combine(basics.end_date, datetime.min.time())
+    currency = basics.currency
     
-    print("\n📅 Travel Dates")
-    start_date = get_date_input("Start date")
-    end_date = get_date_input("End date")
+    # Research the destination in the background while the remaining
+    # questions are answered. The MCP research tool does not use the
+    # budget, so the same open range as MCPGeminiAdapter is passed.
+    print(f"\n🔍 Researching {destination} with Gemini 2.0 Flash (via MCP) in the background...\n")
+    task_id, correlation_id, trace_id = _ids(3)
+    research_task = asyncio.create_task(search_destination_info(
+        destination, start_date, end_date, home_location,
+        (0, 999999), currency,
+        trace_id=trace_id, correlation_id=correlation_id,
+    ))
     
     # Budget information
     print("\n💰 BUDGET")
     print("-" * 40)
-    currency = get_user_input("Currency", "INR")
-    budget_min = get_number_input(f"Minimum budget ({currency})", min_val=0)
-    budget_max = get_number_input(f"Maximum budget ({currency})", min_val=budget_min)
+    budget_min = await get_user_input(f"Minimum budget ({currency})", check=_check_number)
+    budget_max = await get_user_input(f"Maximum budget ({currency})", check=_check_number)
     
     # Preferences
     print("\n🎯 PREFERENCES")
     print("-" * 40)
-    travel_style = get_user_input("Travel style (luxury/balanced/budget)", "balanced")
-    interests_input = get_user_input("Interests (comma-separated)", "culture, food, beaches")
-    interests = [i.strip() for i in interests_input.split(",")]
+    travel_style = await get_user_input("Travel style (luxury/balanced/budget)", "balanced")
+    raw.update(budget_min=budget_min, budget_max=budget_max)
+    trip = await collect_validated(CliTripRequest, {
+        "budget_min": (f"Minimum budget ({currency})", None, _check_number),
+        "budget_max": (f"Maximum budget ({currency})", None, _check_number),
+        "interests": ("Interests (comma-separated)", "culture, food, beaches", None),
+    }, raw)
+    budget_min = trip.budget_min
+    budget_max = trip.budget_max
+    interests = trip.interests
     
-    dietary_input = get_user_input("Dietary restrictions (comma-separated, or press Enter to skip)")
+    dietary_input = await get_user_input("Dietary restrictions (comma-separated, or press Enter to skip)")
     dietary_restrictions = [d.strip() for d in dietary_input.split(",") if d.strip()]
     
-    # Search for destination information
-    destination_info = await search_destination_info(
-        destination, start_date, end_date, home_location, 
-        (budget_min, budget_max), currency
-    )
+    # Collect destination research started earlier
+    if not research_task.done():
+        print(f"\n⏳ Waiting for {destination} research to finish...")
+    destination_info = await research_task
     display_search_results(destination_info)
     
     # Confirm to proceed
-    proceed = get_user_input("Ready to generate your itinerary? (yes/no)", "yes")
+    proceed = await get_user_input("Ready to generate your itinerary? (yes/no)", "yes")
     if proceed.lower() not in ["yes", "y"]:
         print("\n👋 Planning cancelled. Come back anytime!")
         return
@@ -253,10 +663,6 @@ async def interactive_planning():
     )
     
     # Create task context with research data
-    task_id = str(uuid.uuid4())
-    correlation_id = str(uuid.uuid4())
-    trace_id = str(uuid.uuid4())
-    
     context = TaskContext(
         task_id=task_id,
         correlation_id=correlation_id,
@@ -280,7 +686,7 @@ async def interactive_planning():
     print("🚀 GENERATING YOUR PERSONALIZED ITINERARY".center(80))
     print("=" * 80 + "\n")
     
-    listener, adapter = create_monitoring_listener("monitoring_events.json")
+    listener, adapter = create_monitoring_listener("monitoring_events.json", batch=True)
     workflow = DynamicPlannerWorkflow()
     
     try:
@@ -293,13 +699,16 @@ async def interactive_planning():
             trace_id=trace_id,
             correlation_id=correlation_id,
         )
-        callbacks.register_listener(listener)
+        callbacks.register_listener(listener, batch=True)
         
-        itinerary = await workflow.execute(
-            traveler_profile=profile,
-            request_params=request_params,
-            callbacks=callbacks,
-        )
+        try:
+            itinerary = await workflow.execute(
+                traveler_profile=profile,
+                request_params=request_params,
+                callbacks=callbacks,
+            )
+        finally:
+            callbacks.flush()
         
         # Display results
         print("\n" + "=" * 80)
@@ -319,12 +728,25 @@ async def interactive_planning():
         output_dir.mkdir(exist_ok=True)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        json_path = output_dir / f"itinerary_{destination.lower().replace(' ', '_')}_{timestamp}.json"
-        md_path = output_dir / f"itinerary_{destination.lower().replace(' ', '_')}_{timestamp}.md"
-        research_path = output_dir / f"research_{destination.lower().replace(' ', '_')}_{timestamp}.md"
+        dest_slug = destination.lower().replace(' ', '_')
+        json_path = output_dir / f"itinerary_{dest_slug}_{timestamp}.json"
+        md_path = output_dir / f"itinerary_{dest_slug}_{timestamp}.md"
+        research_path = output_dir / f"research_{dest_slug}_{timestamp}.md"
+        
+        # Shared fragments reused by the JSON, Markdown and research outputs
+        start_str = start_date.strftime('%B %d, %Y')
+        end_str = end_date.strftime('%B %d, %Y')
+        budget_str = f"{currency} {budget_min:,.0f}"
+        weather = str(destination_info.get("weather", ""))
+        accommodation = str(destination_info.get("accommodation", ""))
+        attractions = str(destination_info.get("attractions", ""))
+        travel_tips = str(destination_info.get("travel_tips", ""))
+        best_time = str(destination_info.get("best_time", ""))
+        daily_cost = destination_info.get("estimated_daily_cost")
+        daily_cost_str = f"{currency} {daily_cost or 0:,.0f}"
         
         # Save JSON (include research inline)
-        itinerary_json = json.loads(itinerary.model_dump_json())
+        itinerary_json = itinerary.model_dump(mode="json")
         research_json = {
             "weather": destination_info.get("weather", ""),
             "accommodation": destination_info.get("accommodation", ""),
@@ -338,89 +760,79 @@ async def interactive_planning():
             "research": research_json,
             "generated_at": datetime.utcnow().isoformat(),
         }
-        with open(json_path, "w", encoding="utf-8") as f:
-            f.write(json.dumps(combined_payload, indent=2, ensure_ascii=False))
-        print(f"\n💾 JSON saved to: {json_path}")
+        if ORJSON_AVAILABLE:
+            json_content = orjson.dumps(
+                combined_payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            json_content = json.dumps(combined_payload, indent=2, ensure_ascii=False)
         
         # Save Markdown (add At-a-Glance + include research summary inline)
-        weather_snippet = str(destination_info.get("weather", ""))
-        weather_snippet = weather_snippet[:300] + ("…" if len(weather_snippet) > 300 else "")
+        weather_snippet = weather[:300] + ("…" if len(weather) > 300 else "")
         # Extract up to 3 attraction names for quick highlights
-        highlights_line = ""
-        try:
-            attr_raw = destination_info.get("attractions", "")
-            attr_list = json.loads(attr_raw) if isinstance(attr_raw, str) else attr_raw
-            if isinstance(attr_list, list):
-                names = [a.get("name") for a in attr_list if isinstance(a, dict) and a.get("name")]
-                if names:
-                    highlights = ", ".join(names[:3])
-                    highlights_line = f"- Highlights: {highlights}"
-        except Exception:
-            # Graceful fallback: no highlights
-            highlights_line = ""
+        attraction_list = parse_attractions(destination_info.get("attractions"))
+        names = [a["name"] for a in attraction_list if a.get("name")]
+        highlights_line = f"- Highlights: {', '.join(names[:3])}" if names else None
+        # Optional research sections as (heading, body); empty bodies are skipped
+        research_sections = [
+            ("### 🌤️ Weather Information", weather),
+            ("### 🏨 Accommodation Suggestions", accommodation),
+            ("### 🎭 Top Attractions", attractions),
+            ("### 💰 Estimated Daily Cost", f"{daily_cost_str} per day" if daily_cost is not None else ""),
+            ("### 💡 Travel Tips", travel_tips),
+            ("### 📅 Timing Analysis", best_time),
+        ]
+        # None marks an omitted line; "" is a deliberate blank line
         md_sections = [
-            "## 🔎 At-a-Glance",
-            "",
-            f"- Destination: {destination}",
-            f"- Dates: {start_date.strftime('%B %d, %Y')} → {end_date.strftime('%B %d, %Y')}",
-            f"- Origin: {home_location}",
-            f"- Budget: {currency} {budget_min:,.0f} – {budget_max:,.0f}",
-            f"- Est. Daily Cost: {currency} {destination_info.get('estimated_daily_cost', 0):,.0f}",
-            (f"- Weather Snapshot: {weather_snippet}" if weather_snippet else ""),
-            (highlights_line if highlights_line else ""),
-            "",
-            "---",
-            "",
-            itinerary.to_markdown(),
-            "",
-            "---",
-            "",
-            "## 📚 Research Summary",
+            line
+            for line in [
+                "## 🔎 At-a-Glance",
+                "",
+                f"- Destination: {destination}",
+                f"- Dates: {start_str} → {end_str}",
+                f"- Origin: {home_location}",
+                f"- Budget: {budget_str} – {budget_max:,.0f}",
+                f"- Est. Daily Cost: {daily_cost_str}",
+                f"- Weather Snapshot: {weather_snippet}" if weather_snippet else None,
+                highlights_line,
+                "",
+                "---",
+                "",
+                itinerary.to_markdown(),
+                "",
+                "---",
+                "",
+                "## 📚 Research Summary",
+            ]
+            if line is not None
         ]
-        if destination_info.get("weather"):
-            md_sections += ["", "### 🌤️ Weather Information", "", str(destination_info.get("weather", ""))]
-        if destination_info.get("accommodation"):
-            md_sections += ["", "### 🏨 Accommodation Suggestions", "", str(destination_info.get("accommodation", ""))]
-        if destination_info.get("attractions"):
-            md_sections += ["", "### 🎭 Top Attractions", "", str(destination_info.get("attractions", ""))]
-        if destination_info.get("estimated_daily_cost") is not None:
-            md_sections += ["", "### 💰 Estimated Daily Cost", "", f"{currency} {destination_info.get('estimated_daily_cost', 0):,.0f} per day"]
-        if destination_info.get("travel_tips"):
-            md_sections += ["", "### 💡 Travel Tips", "", str(destination_info.get("travel_tips", ""))]
-        if destination_info.get("best_time"):
-            md_sections += ["", "### 📅 Timing Analysis", "", str(destination_info.get("best_time", ""))]
-        md_content = "\n".join(md_sections) + "\n"
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(md_content)
-        print(f"💾 Markdown saved to: {md_path}")
+        for heading, body in research_sections:
+            if body:
+                md_sections += ["", heading, "", body]
+        
+        # Research Results
+        research_content = RESEARCH_MARKDOWN_TEMPLATE.format_map({
+            "destination": destination,
+            "research_date": datetime.now().strftime('%B %d, %Y at %I:%M %p'),
+            "start": start_str,
+            "end": end_str,
+            "budget": f"{budget_str} - {budget_max:,.0f}",
+            "weather": weather,
+            "accommodation": accommodation,
+            "attractions": attractions,
+            "daily_cost": daily_cost_str,
+            "travel_tips": travel_tips,
+            "best_time": best_time,
+        })
         
-        # Save Research Results
-        with open(research_path, "w", encoding="utf-8") as f:
-            f.write(f"# Travel Research: {destination}\n\n")
-            f.write(f"**Research Date:** {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n")
-            f.write(f"**Destination:** {destination}\n")
-            f.write(f"**Travel Dates:** {start_date.strftime('%B %d, %Y')} to {end_date.strftime('%B %d, %Y')}\n")
-            f.write(f"**Budget:** {currency} {budget_min:,.0f} - {budget_max:,.0f}\n\n")
-            f.write("---\n\n")
-            
-            f.write("## 🌤️ Weather Information\n\n")
-            f.write(destination_info.get("weather", "") + "\n\n")
-            
-            f.write("## 🏨 Accommodation Suggestions\n\n")
-            f.write(destination_info.get("accommodation", "") + "\n\n")
-            
-            f.write("## 🎭 Top Attractions\n\n")
-            f.write(destination_info.get("attractions", "") + "\n\n")
-            
-            f.write("## 💰 Estimated Daily Cost\n\n")
-            f.write(f"{currency} {destination_info.get('estimated_daily_cost', 0):,.0f} per day\n\n")
-            
-            f.write("## 💡 Travel Tips\n\n")
-            f.write(destination_info.get("travel_tips", "") + "\n\n")
-            
-            f.write("## 📅 Best Time to Visit\n\n")
-            f.write(destination_info.get("best_time", "") + "\n\n")
-            
+        # Write all outputs concurrently off the event loop
+        await asyncio.gather(
+            write_text_file(json_path, json_content),
+            write_lines_file(md_path, md_sections),
+            write_text_file(research_path, research_content),
+        )
+        print(f"\n💾 JSON saved to: {json_path}")
+        print(f"💾 Markdown saved to: {md_path}")
         print(f"💾 Research saved to: {research_path}")
         
         print("\n" + "=" * 80)
@@ -436,10 +848,12 @@ async def interactive_planning():
             adapter.close()
         except Exception:
             pass
+        await close_http_client()
 
 
 def main():
     """Main entry point."""
+    install_uvloop()
     try:
         asyncio.run(interactive_planning())
     except KeyboardInterrupt:
@@ -4,59 +4,143 @@ Structured JSON logger with correlation ID support.
 Provides structured logging capabilities for observability and debugging.
 """
 
+import functools
 import json
 import logging
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 from src.config.settings import get_settings
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize a log payload to a compact JSON string.
+    
+    Uses orjson when installed; unknown types fall back to str() and
+    non-string dict keys are stringified, as with the stdlib encoder.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, default=str)
+
+
+# Standard LogRecord attributes that are not copied into the JSON payload
+_STD_LOGRECORD_ATTRS = frozenset({
+    "name", "msg", "args", "created", "filename", "funcName",
+    "levelname", "levelno", "lineno", "module", "msecs",
+    "message", "pathname", "process", "processName", "relativeCreated",
+    "thread", "threadName", "exc_info", "exc_text", "stack_info", "taskName",
+})
+
+
+class Preview:
+    """
+    Deferred, truncated rendering of a log field.
+    
+    Wrap potentially large values passed via ``extra`` so they are only
+    serialized when a handler actually emits the record:
+    
+        logger.info("Tool call", extra={"arguments": Preview(arguments)})
+    """
+    
+    __slots__ = ("value", "limit")
+    
+    def __init__(self, value: Any, limit: int = 100) -> None:
+        """
+        Initialize preview.
+        
+        Args:
+            value: Value to render
+            limit: Maximum rendered length in characters
+        """
+        self.value = value
+        self.limit = limit
+    
+    def render(self) -> str:
+        """Render the value as JSON, truncated to the limit."""
+        text = json.dumps(self.value, default=str)
+        if len(text) <= self.limit:
+            return text
+        return text[:self.limit] + "..."
+
+
+class PreviewFilter(logging.Filter):
+    """Handler filter that renders Preview fields at emit time."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Replace Preview values on the record with their rendered text."""
+        for key, value in record.__dict__.items():
+            if isinstance(value, Preview):
+                record.__dict__[key] = value.render()
+        return True
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs structured JSON logs."""
     
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (whole second, formatted UTC date/time) for the most recent record;
+        # swapped as one tuple so handlers sharing the formatter never see
+        # a second paired with another second's prefix
+        self._last: Tuple[int, str] = (-1, "")
+    
+    def _timestamp(self, created: float) -> str:
+        """
+        Format a record's creation time as an ISO 8601 UTC timestamp.
+        
+        The date/time part only changes once per second, so it is cached
+        and just the microseconds are formatted per record.
+        """
+        second = int(created)
+        last_second, prefix = self._last
+        if second != last_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._last = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}"
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         
-        # Add extra fields from record
-        if hasattr(record, "trace_id"):
-            log_data["trace_id"] = record.trace_id
-        if hasattr(record, "correlation_id"):
-            log_data["correlation_id"] = record.correlation_id
-        if hasattr(record, "task_id"):
-            log_data["task_id"] = record.task_id
-        if hasattr(record, "agent_id"):
-            log_data["agent_id"] = record.agent_id
-        
-        # Add any other extra attributes
+        # Add correlation context and any other extra attributes in one pass
         for key, value in record.__dict__.items():
-            if key not in [
-                "name", "msg", "args", "created", "filename", "funcName",
-                "levelname", "levelno", "lineno", "module", "msecs",
-                "message", "pathname", "process", "processName", "relativeCreated",
-                "thread", "threadName", "exc_info", "exc_text", "stack_info",
-                "trace_id", "correlation_id", "task_id", "agent_id",
-            ]:
+            if key not in _STD_LOGRECORD_ATTRS:
                 log_data[key] = value
         
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data)
+        return dumps(log_data)
 
 
+# Shared by every console handler; neither keeps per-logger state
+_FORMATTER = StructuredFormatter()
+_PREVIEW_FILTER = PreviewFilter()
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a structured logger instance.
     
+    Memoized per name: loggers are process-global and the formatter is
+    stateless, so every caller can share one configured instance.
+    
     Args:
         name: Logger name (typically __name__)
         
@@ -73,7 +157,8 @@ def get_logger(name: str) -> logging.Logger:
     
     # Console handler with structured formatting
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(StructuredFormatter())
+    console_handler.setFormatter(_FORMATTER)
+    console_handler.addFilter(_PREVIEW_FILTER)
     logger.addHandler(console_handler)
     
     # Optional: File handler for monitoring events
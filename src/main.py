@@ -19,6 +19,8 @@ from src.config.settings import get_settings
 from src.models.itinerary import TravelerPreferences, TravelerProfile
 from src.workflows.dynamic_planner import DynamicPlannerWorkflow
 from src.logging.json_logger import get_logger
+from src.utils.http import close_http_client
+from src.utils.runtime import install_uvloop
 
 logger = get_logger(__name__)
 
@@ -72,9 +74,9 @@ async def run_planning_workflow(input_file: str) -> None:
     # Register logging listener
     if settings.enable_monitoring:
         listener, adapter = create_monitoring_listener(
-            log_file="monitoring_events.json"
+            log_file="monitoring_events.json", batch=True
         )
-        callbacks.register_listener(listener)
+        callbacks.register_listener(listener, batch=True)
     
     logger.info(
         f"Starting travel planning for {traveler_profile.name}",
@@ -87,11 +89,15 @@ async def run_planning_workflow(input_file: str) -> None:
     
     # Execute workflow
     workflow = DynamicPlannerWorkflow()
-    itinerary = await workflow.execute(
-        traveler_profile=traveler_profile,
-        request_params=request_params,
-        callbacks=callbacks,
-    )
+    try:
+        itinerary = await workflow.execute(
+            traveler_profile=traveler_profile,
+            request_params=request_params,
+            callbacks=callbacks,
+        )
+    finally:
+        callbacks.flush()
+        await close_http_client()
     
     # Output results
     print("\n" + "=" * 80)
@@ -106,8 +112,7 @@ async def run_planning_workflow(input_file: str) -> None:
     # Save JSON to file
     output_json_path = Path("examples") / "generated_itinerary.json"
     output_json_path.parent.mkdir(exist_ok=True)
-    with open(output_json_path, "w", encoding="utf-8") as f:
-        f.write(json_output)
+    output_json_path.write_text(json_output, encoding="utf-8")
     print(f"\nJSON saved to: {output_json_path}")
     
     # Markdown output
@@ -119,8 +124,7 @@ async def run_planning_workflow(input_file: str) -> None:
     
     # Save Markdown to file
     output_md_path = Path("examples") / "generated_itinerary.md"
-    with open(output_md_path, "w", encoding="utf-8") as f:
-        f.write(markdown_output)
+    output_md_path.write_text(markdown_output, encoding="utf-8")
     print(f"\nMarkdown saved to: {output_md_path}")
     
     logger.info(
@@ -161,6 +165,7 @@ def main() -> None:
         sys.exit(1)
     
     # Run async workflow
+    install_uvloop()
     try:
         asyncio.run(run_planning_workflow(input_file))
     except KeyboardInterrupt:
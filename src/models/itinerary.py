@@ -9,20 +9,39 @@ This module defines all data models used throughout the application including:
 - TaskContext: shared context between agents
 """
 
-from datetime import datetime
+import functools
+from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from operator import attrgetter
+from typing import Annotated, Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+from pydantic_core import PydanticSerializationError
+
+# Money amounts stay Decimal in Python but are written to JSON as numbers
+DecimalAsFloat = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_strftime(value: datetime, utcoffset: Optional[timedelta], fmt: str) -> str:
+    return value.strftime(fmt)
+
+
+def _format_datetime(value: datetime, fmt: str) -> str:
+    """
+    strftime, memoized: itinerary times repeat across segments and exports.
+    
+    Aware datetimes for the same instant compare equal whatever their
+    timezone, so the UTC offset is part of the cache key.
+    """
+    return _cached_strftime(value, value.utcoffset(), fmt)
 
 
 class TravelerPreferences(BaseModel):
     """Travel preferences for personalization."""
-    model_config = ConfigDict(json_encoders={Decimal: float})
-    
-    budget_min: Decimal = Field(description="Minimum budget in default currency")
-    budget_max: Decimal = Field(description="Maximum budget in default currency")
+    budget_min: DecimalAsFloat = Field(description="Minimum budget in default currency")
+    budget_max: DecimalAsFloat = Field(description="Maximum budget in default currency")
     travel_style: str = Field(
         default="balanced",
         description="Travel style: budget, balanced, luxury"
@@ -57,6 +76,8 @@ class TravelerProfile(BaseModel):
 
 class Location(BaseModel):
     """Geographic location with coordinates."""
+    # Frozen so one instance can be shared by many segments and offers
+    model_config = ConfigDict(frozen=True)
     
     name: str = Field(description="Location name")
     city: str = Field(description="City name")
@@ -68,20 +89,11 @@ class Location(BaseModel):
 
 class PricingBreakdown(BaseModel):
     """Detailed pricing breakdown for an offer."""
-    model_config = ConfigDict(json_encoders={Decimal: float})
-    
-    base_price: Decimal = Field(description="Base price before fees")
-    taxes: Decimal = Field(default=Decimal("0.00"), description="Tax amount")
-    fees: Decimal = Field(default=Decimal("0.00"), description="Service fees")
-    total: Decimal = Field(description="Total price")
+    base_price: DecimalAsFloat = Field(description="Base price before fees")
+    taxes: DecimalAsFloat = Field(default=Decimal("0.00"), description="Tax amount")
+    fees: DecimalAsFloat = Field(default=Decimal("0.00"), description="Service fees")
+    total: DecimalAsFloat = Field(description="Total price")
     currency: str = Field(default="USD", description="Currency code")
-    
-    @field_validator("total")
-    @classmethod
-    def validate_total(cls, v: Decimal, info: Any) -> Decimal:
-        """Ensure total matches sum of components."""
-        # Note: In Pydantic v2, validators receive info instead of values
-        return v
 
 
 class OfferType(str, Enum):
@@ -163,38 +175,42 @@ class Itinerary(BaseModel):
             f"# Travel Itinerary: {self.destination}",
             "",
             f"**Traveler:** {self.traveler_profile.name}",
-            f"**Dates:** {self.start_date.strftime('%B %d, %Y')} - {self.end_date.strftime('%B %d, %Y')}",
+            f"**Dates:** {_format_datetime(self.start_date, '%B %d, %Y')} - {_format_datetime(self.end_date, '%B %d, %Y')}",
             f"**Total Cost:** {self.total_cost.currency} {self.total_cost.total}",
             "",
             "---",
             "",
         ]
         
-        # Group segments by day
+        # Bucket segments by day in one pass; each day holds only a few
+        # segments, so ordering them per day is cheaper than a global sort
         segments_by_day: Dict[int, List[ItinerarySegment]] = {}
-        for segment in sorted(self.segments, key=lambda s: (s.day, s.order)):
-            if segment.day not in segments_by_day:
-                segments_by_day[segment.day] = []
-            segments_by_day[segment.day].append(segment)
+        for segment in self.segments:
+            segments_by_day.setdefault(segment.day, []).append(segment)
         
-        for day, day_segments in sorted(segments_by_day.items()):
+        for day in sorted(segments_by_day):
+            day_segments = segments_by_day[day]
+            day_segments.sort(key=attrgetter("order"))
             lines.append(f"## Day {day}")
             lines.append("")
             for seg in day_segments:
-                lines.append(f"### {seg.start_time.strftime('%I:%M %p')} - {seg.title}")
-                lines.append(f"**Location:** {seg.location.name}, {seg.location.city}")
-                lines.append(f"**Duration:** {seg.start_time.strftime('%I:%M %p')} - {seg.end_time.strftime('%I:%M %p')}")
-                lines.append("")
-                lines.append(seg.description)
-                if seg.offer:
-                    lines.append(
-                        f"\n**Cost:** {seg.offer.pricing.currency} {seg.offer.pricing.total}"
-                    )
-                if seg.notes:
-                    lines.append(f"\n*Note: {seg.notes}*")
-                lines.append("")
-                lines.append("---")
-                lines.append("")
+                start = _format_datetime(seg.start_time, "%I:%M %p")
+                end = _format_datetime(seg.end_time, "%I:%M %p")
+                cost_line = (
+                    f"\n\n**Cost:** {seg.offer.pricing.currency} {seg.offer.pricing.total}"
+                    if seg.offer else ""
+                )
+                notes_line = f"\n\n*Note: {seg.notes}*" if seg.notes else ""
+                # One string per segment (joined to the rest with "\n")
+                lines.append(
+                    f"### {start} - {seg.title}\n"
+                    f"**Location:** {seg.location.name}, {seg.location.city}\n"
+                    f"**Duration:** {start} - {end}\n"
+                    "\n"
+                    f"{seg.description}{cost_line}{notes_line}\n"
+                    "\n"
+                    "---\n"
+                )
         
         if self.optimization_notes:
             lines.append("## Optimization Notes")
@@ -288,17 +304,16 @@ class MonitoringEvent(BaseModel):
     )
     
     def to_log_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary suitable for JSON logging."""
-        return {
-            "event_id": self.event_id,
-            "event_type": self.event_type.value,
-            "severity": self.severity.value,
-            "timestamp": self.timestamp.isoformat(),
-            "trace_id": self.trace_id,
-            "correlation_id": self.correlation_id,
-            "task_id": self.task_id,
-            "agent_id": self.agent_id,
-            "message": self.message,
-            "data": self.data,
-            "error": self.error,
-        }
+        """
+        Convert to dictionary suitable for JSON logging.
+        
+        Serialized by pydantic-core (enum values, ISO timestamps). If data
+        holds a value pydantic cannot serialize it is passed through as-is
+        for the log formatter to stringify.
+        """
+        try:
+            return self.model_dump(mode="json")
+        except PydanticSerializationError:
+            log_dict = self.model_dump(mode="json", exclude={"data"})
+            log_dict["data"] = self.data
+            return log_dict
@@ -5,15 +5,29 @@ Provides an interface for state management and implementations for
 in-memory and Redis backends.
 """
 
+import fnmatch
+import functools
+import heapq
+import re
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.logging.json_logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# Characters with special meaning in glob-style key patterns
+_GLOB_CHARS = frozenset("*?[")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob-style key pattern (e.g., "flight:*:offers") to a regex."""
+    return re.compile(fnmatch.translate(pattern))
+
+
 class StateStore(ABC):
     """Abstract interface for state storage."""
     
@@ -100,24 +114,47 @@ class InMemoryStateStore(StateStore):
     In-memory implementation of state store.
     
     Suitable for development and testing. Data is lost when process terminates.
+    
+    Each operation also has a *_sync variant for callers that hold an
+    InMemoryStateStore directly and want to skip the coroutine overhead.
+    
+    Expired keys are evicted lazily at the start of each operation; no
+    background sweeper task runs.
     """
     
-    def __init__(self) -> None:
-        """Initialize the in-memory store."""
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize the in-memory store.
+        
+        Args:
+            clock: Monotonic time source in seconds, used for TTL expiry
+        """
+        self._clock = clock
         self._store: Dict[str, Any] = {}
-        self._expiry: Dict[str, datetime] = {}
+        # key -> expiry as a clock() deadline
+        self._expiry: Dict[str, float] = {}
+        # Min-heap of (expiry, key); entries no longer matching _expiry are stale
+        self._expiry_heap: List[Tuple[float, str]] = []
     
     def _cleanup_expired(self) -> None:
-        """Remove expired keys."""
-        now = datetime.utcnow()
-        expired = [key for key, expiry in self._expiry.items() if expiry <= now]
-        for key in expired:
-            self._store.pop(key, None)
-            self._expiry.pop(key, None)
+        """Remove expired keys, popping only heap entries that are due."""
+        if not self._expiry:
+            # Every remaining heap entry was superseded
+            self._expiry_heap.clear()
+            return
+        now = self._clock()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            # Skip entries superseded by a later set() or delete()
+            if self._expiry.get(key) == expiry:
+                self._store.pop(key, None)
+                del self._expiry[key]
     
-    async def get(self, key: str) -> Optional[Any]:
-        """Get a value from the store."""
-        self._cleanup_expired()
+    def get_sync(self, key: str) -> Optional[Any]:
+        """Get a value from the store (synchronous)."""
+        if self._expiry_heap:
+            self._cleanup_expired()
         value = self._store.get(key)
         
         if value is not None:
@@ -125,22 +162,26 @@ class InMemoryStateStore(StateStore):
         
         return value
     
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Set a value in the store."""
-        self._cleanup_expired()
+    def set_sync(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set a value in the store (synchronous)."""
+        if self._expiry_heap:
+            self._cleanup_expired()
         self._store[key] = value
         
         if ttl is not None:
-            self._expiry[key] = datetime.utcnow() + timedelta(seconds=ttl)
+            expiry = self._clock() + ttl
+            self._expiry[key] = expiry
+            heapq.heappush(self._expiry_heap, (expiry, key))
         else:
             self._expiry.pop(key, None)
         
         logger.debug(f"State stored: {key} (ttl={ttl})")
         return True
     
-    async def delete(self, key: str) -> bool:
-        """Delete a value from the store."""
-        self._cleanup_expired()
+    def delete_sync(self, key: str) -> bool:
+        """Delete a value from the store (synchronous)."""
+        if self._expiry_heap:
+            self._cleanup_expired()
         
         if key in self._store:
             del self._store[key]
@@ -150,36 +191,63 @@ class InMemoryStateStore(StateStore):
         
         return False
     
-    async def exists(self, key: str) -> bool:
-        """Check if a key exists."""
-        self._cleanup_expired()
+    def exists_sync(self, key: str) -> bool:
+        """Check if a key exists (synchronous)."""
+        if self._expiry_heap:
+            self._cleanup_expired()
         return key in self._store
     
-    async def list_keys(self, pattern: Optional[str] = None) -> List[str]:
-        """List all keys in the store."""
-        self._cleanup_expired()
-        keys = list(self._store.keys())
+    def list_keys_sync(self, pattern: Optional[str] = None) -> List[str]:
+        """List all keys in the store (synchronous)."""
+        if self._expiry_heap:
+            self._cleanup_expired()
+        
+        if not pattern:
+            return list(self._store)
         
-        if pattern:
-            # Simple wildcard matching (* at start/end)
-            if pattern.endswith("*"):
-                prefix = pattern[:-1]
-                keys = [k for k in keys if k.startswith(prefix)]
-            elif pattern.startswith("*"):
-                suffix = pattern[1:]
-                keys = [k for k in keys if k.endswith(suffix)]
-            else:
-                keys = [k for k in keys if pattern in k]
+        # Plain "prefix*" patterns (e.g., "flight:*") need no regex
+        prefix = pattern[:-1]
+        if pattern.endswith("*") and not _GLOB_CHARS.intersection(prefix):
+            return [k for k in self._store if k.startswith(prefix)]
         
-        return keys
+        # Glob matching (*, ?, [...]) anywhere in the pattern, as in Redis KEYS
+        match = _compile_pattern(pattern).match
+        return [k for k in self._store if match(k)]
     
-    async def clear(self) -> int:
-        """Clear all data from the store."""
+    def clear_sync(self) -> int:
+        """Clear all data from the store (synchronous)."""
         count = len(self._store)
         self._store.clear()
         self._expiry.clear()
+        self._expiry_heap.clear()
         logger.info(f"State store cleared: {count} keys removed")
         return count
+    
+    # Async StateStore interface; the in-memory operations never need to await
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value from the store."""
+        return self.get_sync(key)
+    
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set a value in the store."""
+        return self.set_sync(key, value, ttl)
+    
+    async def delete(self, key: str) -> bool:
+        """Delete a value from the store."""
+        return self.delete_sync(key)
+    
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        return self.exists_sync(key)
+    
+    async def list_keys(self, pattern: Optional[str] = None) -> List[str]:
+        """List all keys in the store."""
+        return self.list_keys_sync(pattern)
+    
+    async def clear(self) -> int:
+        """Clear all data from the store."""
+        return self.clear_sync()
 
 
 class RedisStateStore(StateStore):
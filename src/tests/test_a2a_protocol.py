@@ -137,3 +137,25 @@ def test_compute_hmac_signature() -> None:
     # Different secret should produce different signature
     signature3 = compute_hmac_signature(message, "different-secret")
     assert signature1 != signature3
+
+
+def test_hmac_signature_canonical_types() -> None:
+    """Test that Decimal and date payload values sign like their JSON forms."""
+    from datetime import date
+    from decimal import Decimal
+    
+    def build(payload: dict) -> A2AMessage:
+        return A2AMessage(
+            message_id="msg-1",
+            message_type="test",
+            payload=payload,
+            trace_id="trace-1",
+            correlation_id="corr-1",
+            meta=A2AMetadata(sender="agent-1"),
+        )
+    
+    typed = build({"cost": Decimal("12.5"), "day": date(2025, 12, 1)})
+    plain = build({"cost": 12.5, "day": "2025-12-01"})
+    plain.timestamp = typed.timestamp
+    
+    assert compute_hmac_signature(typed, "secret") == compute_hmac_signature(plain, "secret")
@@ -0,0 +1,68 @@
+"""
+Unit tests for the budget calculator.
+
+Tests multi-currency totals and concurrent exchange rate lookups.
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from src.integrations.calculator import BudgetCalculator, CurrencyRate
+
+
+class _TrackingCalculator(BudgetCalculator):
+    """Calculator whose rate lookups record how many run at once."""
+
+    def __init__(self, failing_currency: str = "") -> None:
+        super().__init__()
+        self.failing_currency = failing_currency
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_exchange_rate(self, from_currency: str, to_currency: str) -> CurrencyRate:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if from_currency == self.failing_currency:
+                raise ValueError(f"No rate for {from_currency}")
+            return await super().get_exchange_rate(from_currency, to_currency)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_calculate_total_async_fetches_rates_concurrently() -> None:
+    """Test that every foreign rate is fetched at once and totals are correct."""
+    calculator = _TrackingCalculator()
+
+    total = await calculator.calculate_total_async(
+        {"USD": Decimal("10"), "EUR": Decimal("85"), "INR": Decimal("745"), "GBP": Decimal("73")}
+    )
+
+    # 10 USD + 100 USD + 10 USD + 100 USD
+    assert total == Decimal("220.00")
+    assert calculator.max_in_flight == 3
+    assert set(calculator._rate_cache) == {("EUR", "USD"), ("INR", "USD"), ("GBP", "USD")}
+
+
+@pytest.mark.asyncio
+async def test_calculate_total_async_raises_on_failed_rate() -> None:
+    """Test that a failed pair lookup fails the total instead of skipping it."""
+    calculator = _TrackingCalculator(failing_currency="EUR")
+
+    with pytest.raises(ValueError, match="No rate for EUR"):
+        await calculator.calculate_total_async(
+            {"EUR": Decimal("85"), "INR": Decimal("745")}, target_currency="USD"
+        )
+
+
+def test_calculate_total_sync_wrapper() -> None:
+    """Test that the sync wrapper matches the async total."""
+    calculator = BudgetCalculator()
+
+    total = calculator.calculate_total({"USD": Decimal("5"), "INR": Decimal("74.5")})
+
+    assert total == Decimal("6.00")
@@ -167,3 +167,32 @@ def test_on_agent_message() -> None:
     event = events_received[0]
     assert event.event_type == EventType.AGENT_MESSAGE
     assert event.data["message_type"] == "proposal"
+
+
+def test_batch_listener_flushes() -> None:
+    """Test batch delivery on size threshold, on errors and on explicit flush."""
+    callbacks = MonitoringCallbacks(
+        trace_id="trace-1",
+        correlation_id="corr-1",
+        batch_size=2,
+    )
+    
+    single = []
+    batches = []
+    callbacks.register_listener(lambda e: single.append(e))
+    callbacks.register_listener(lambda events: batches.append(events), batch=True)
+    
+    callbacks.on_task_start(task_id="task-1", agent_id="agent-1", message="a")
+    assert len(single) == 1 and batches == []
+    
+    callbacks.on_task_start(task_id="task-2", agent_id="agent-1", message="b")
+    assert [len(b) for b in batches] == [2]
+    
+    callbacks.on_task_error(task_id="task-3", agent_id="agent-1", error=ValueError("x"))
+    assert [len(b) for b in batches] == [2, 1]
+    
+    callbacks.on_task_start(task_id="task-4", agent_id="agent-1", message="c")
+    callbacks.flush()
+    callbacks.flush()
+    assert [len(b) for b in batches] == [2, 1, 1]
+    assert [e for b in batches for e in b] == single
@@ -0,0 +1,65 @@
+"""
+Unit tests for the dynamic planner workflow helpers.
+
+Tests schedule time parsing and itinerary segment construction.
+"""
+
+from datetime import datetime
+
+from src.models.itinerary import Location
+from src.workflows.dynamic_planner import DynamicPlannerWorkflow
+
+
+def test_parse_time_range() -> None:
+    """Test time range parsing, end-before-start correction and fallbacks."""
+    workflow = DynamicPlannerWorkflow.__new__(DynamicPlannerWorkflow)
+    base = datetime(2025, 12, 2)
+    
+    assert workflow._parse_time_range("9:00 AM - 11:30 AM", base) == (
+        datetime(2025, 12, 2, 9, 0),
+        datetime(2025, 12, 2, 11, 30),
+    )
+    assert workflow._parse_time_range("1:00 PM - 12:00 PM", base) == (
+        datetime(2025, 12, 2, 13, 0),
+        datetime(2025, 12, 2, 14, 0),
+    )
+    
+    fallback = (datetime(2025, 12, 2, 9, 0), datetime(2025, 12, 2, 10, 0))
+    assert workflow._parse_time_range("", base) == fallback
+    assert workflow._parse_time_range("morning - noon", base) == fallback
+
+
+def test_activity_segments_share_default_location() -> None:
+    """Test that activities at the destination reuse one Location instance."""
+    workflow = DynamicPlannerWorkflow.__new__(DynamicPlannerWorkflow)
+    default_location = Location(name="Goa", city="Goa", country="")
+    schedule = [
+        {"day": 1, "activities": [{"name": "Market", "cost": 10}, {"name": "Fort", "location": "Aguada"}]},
+        {"day": 2, "activities": [{"name": "Beach", "time": "bad"}]},
+    ]
+    
+    segments = workflow._build_activity_segments(
+        schedule, "Goa", default_location, datetime(2025, 12, 1), order_start=3, id_prefix="task1234"
+    )
+    
+    assert [s.order for s in segments] == [3, 4, 5]
+    assert [s.segment_id for s in segments] == ["seg-task1234-3", "seg-task1234-4", "seg-task1234-5"]
+    assert segments[0].offer.offer_id == "activity-task1234-3"
+    assert [s.day for s in segments] == [1, 1, 2]
+    assert segments[0].location is default_location
+    assert segments[0].offer.location is default_location
+    assert segments[1].location.name == "Aguada"
+    assert segments[1].location is segments[1].offer.location
+    assert segments[2].location is default_location
+
+
+def test_to_decimal_matches_string_conversion() -> None:
+    """Test that plan amounts convert exactly as Decimal(str(value)) would."""
+    from decimal import Decimal
+    
+    from src.workflows.dynamic_planner import _to_decimal
+    
+    for value in (0, 1500, 0.1, 99.99, "250.50", Decimal("12.30")):
+        converted = _to_decimal(value)
+        assert converted == Decimal(str(value))
+        assert str(converted) == str(Decimal(str(value)))
@@ -0,0 +1,163 @@
+"""
+Unit tests for the Gemini research client.
+
+Tests batched multi-destination research with a stubbed Gemini call.
+"""
+
+import json
+from typing import List, Optional
+
+import httpx
+import pytest
+
+from src.integrations.gemini_research import (
+    MAX_BATCH_DESTINATIONS,
+    GeminiResearchClient,
+    TripQuery,
+)
+
+
+def _trip(destination: str) -> TripQuery:
+    return TripQuery(
+        destination=destination,
+        start_date="2026-12-01",
+        end_date="2026-12-05",
+        home_location="Mumbai",
+        budget_range=(1000.0, 5000.0),
+    )
+
+
+def _research(destination: str) -> dict:
+    return {
+        "destination": destination,
+        "weather_summary": f"{destination} weather",
+        "accommodation_suggestions": "",
+        "top_attractions": "",
+        "estimated_daily_cost": 3000,
+        "currency": "INR",
+        "travel_tips": "",
+        "best_time_to_visit": "",
+    }
+
+
+def _stub_generate(client: GeminiResearchClient, batch_response: Optional[str]) -> List[str]:
+    """
+    Stub Gemini: batch prompts get batch_response, single prompts get
+    research for their destination. Returns the prompts seen.
+    """
+    prompts = []
+
+    async def generate(prompt: str, max_output_tokens: int) -> Optional[str]:
+        prompts.append(prompt)
+        if "multi-city trip" in prompt:
+            return batch_response
+        destination = prompt.split("- Destination: ", 1)[1].split("\n", 1)[0]
+        return json.dumps(_research(destination))
+
+    client._generate = generate
+    return prompts
+
+
+@pytest.mark.asyncio
+async def test_research_destinations_parses_batch() -> None:
+    """Test that one batched JSON array becomes per-trip results in order."""
+    client = GeminiResearchClient(api_key="test-key")
+    batch = "```json\n" + json.dumps([_research("Goa"), _research("Pune")]) + "\n```"
+    prompts = _stub_generate(client, batch)
+
+    results = await client.research_destinations([_trip("Goa"), _trip("Pune")])
+
+    assert len(prompts) == 1
+    assert [r.destination for r in results] == ["Goa", "Pune"]
+    assert results[1].weather_summary == "Pune weather"
+    assert not any(r.is_mock for r in results)
+
+
+@pytest.mark.asyncio
+async def test_research_destinations_falls_back_on_length_mismatch() -> None:
+    """Test that a short batch response is retried with per-trip calls."""
+    client = GeminiResearchClient(api_key="test-key")
+    prompts = _stub_generate(client, json.dumps([_research("Goa")]))
+
+    results = await client.research_destinations([_trip("Goa"), _trip("Pune")])
+
+    assert len(prompts) == 3
+    assert [r.destination for r in results] == ["Goa", "Pune"]
+    assert not any(r.is_mock for r in results)
+
+
+@pytest.mark.asyncio
+async def test_research_destinations_falls_back_when_batch_raises() -> None:
+    """Test that a failing batch call is retried per trip instead of mocked."""
+    client = GeminiResearchClient(api_key="test-key")
+    prompts = _stub_generate(client, "[]")
+    per_trip = client._generate
+
+    async def generate(prompt: str, max_output_tokens: int) -> str:
+        if "multi-city trip" in prompt:
+            prompts.append(prompt)
+            raise httpx.HTTPError("503 Service Unavailable")
+        return await per_trip(prompt, max_output_tokens)
+
+    client._generate = generate
+
+    results = await client.research_destinations([_trip("Goa"), _trip("Pune")])
+
+    assert len(prompts) == 3
+    assert [r.weather_summary for r in results] == ["Goa weather", "Pune weather"]
+    assert not any(r.is_mock for r in results)
+
+
+@pytest.mark.asyncio
+async def test_research_destinations_falls_back_without_candidates() -> None:
+    """Test that an empty batch reply is retried per trip."""
+    client = GeminiResearchClient(api_key="test-key")
+    prompts = _stub_generate(client, None)
+
+    results = await client.research_destinations([_trip("Goa"), _trip("Pune")])
+
+    assert len(prompts) == 3
+    assert not any(r.is_mock for r in results)
+
+
+@pytest.mark.asyncio
+async def test_research_destinations_splits_large_trips() -> None:
+    """Test that more than MAX_BATCH_DESTINATIONS trips skip the batch prompt."""
+    client = GeminiResearchClient(api_key="test-key")
+    prompts = _stub_generate(client, "[]")
+    names = [f"City{i}" for i in range(MAX_BATCH_DESTINATIONS + 1)]
+
+    results = await client.research_destinations([_trip(name) for name in names])
+
+    assert len(prompts) == len(names)
+    assert not any("multi-city trip" in prompt for prompt in prompts)
+    assert [r.destination for r in results] == names
+
+
+@pytest.mark.asyncio
+async def test_research_destinations_single_trip() -> None:
+    """Test that a single trip uses the per-destination prompt."""
+    client = GeminiResearchClient(api_key="test-key")
+    prompts = _stub_generate(client, "[]")
+
+    (result,) = await client.research_destinations([_trip("Goa")])
+
+    assert len(prompts) == 1
+    assert "multi-city trip" not in prompts[0]
+    assert result.weather_summary == "Goa weather"
+
+
+@pytest.mark.asyncio
+async def test_research_destinations_without_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that every trip gets mock research when no API key is configured."""
+    from src.integrations import gemini_research
+
+    monkeypatch.setattr(gemini_research.get_settings(), "gemini_api_key", None)
+    client = GeminiResearchClient()
+    prompts = _stub_generate(client, "[]")
+
+    results = await client.research_destinations([_trip("Goa"), _trip("Pune")])
+
+    assert prompts == []
+    assert [r.destination for r in results] == ["Goa", "Pune"]
+    assert all(r.is_mock for r in results)
@@ -0,0 +1,197 @@
+"""
+Unit tests for the Groq client.
+
+Tests streamed chat completions against a mocked HTTP transport.
+"""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from src.integrations import groq_client
+from src.integrations.groq_client import GroqClient
+from src.integrations.semantic_cache import SemanticCache
+
+
+def _json_body(request: httpx.Request) -> dict:
+    body = request.content
+    if request.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
+def _sse_body(*fragments: str) -> bytes:
+    lines = [
+        "data: " + json.dumps({"choices": [{"delta": {"content": fragment}}]})
+        for fragment in fragments
+    ]
+    lines.append("data: [DONE]")
+    return ("\n\n".join(lines) + "\n\n").encode("utf-8")
+
+
+@pytest.fixture
+def requests_seen(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Route the shared HTTP client to a mock SSE endpoint."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            content=_sse_body('{"city": ', '"Goa"}'),
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(groq_client, "get_http_client", lambda: client)
+    return seen
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_yields_fragments(requests_seen: list) -> None:
+    """Test that streamed deltas are yielded as they arrive."""
+    client = GroqClient(api_key="test-key", cache=SemanticCache())
+
+    fragments = [chunk async for chunk in client.chat_stream("plan goa")]
+
+    assert fragments == ['{"city": ', '"Goa"}']
+    assert _json_body(requests_seen[0])["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_chat_request_body(requests_seen: list) -> None:
+    """Test that the pre-encoded request body matches the chat payload."""
+    client = GroqClient(api_key="test-key", model="m", cache=SemanticCache())
+
+    await client.chat('plan "goa"', system_prompt="be brief", temperature=0.2, max_tokens=50)
+
+    assert _json_body(requests_seen[0]) == {
+        "model": "m",
+        "messages": [
+            {"role": "system", "content": "be brief"},
+            {"role": "user", "content": 'plan "goa"'},
+        ],
+        "temperature": 0.2,
+        "max_tokens": 50,
+        "stream": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_chat_joins_stream_and_caches(requests_seen: list) -> None:
+    """Test that chat returns the full text and caches it at temperature 0."""
+    client = GroqClient(api_key="test-key", cache=SemanticCache())
+
+    assert await client.chat("plan goa", temperature=0) == '{"city": "Goa"}'
+    assert await client.chat("plan goa", temperature=0) == '{"city": "Goa"}'
+    assert len(requests_seen) == 1
+
+    # Sampled calls always reach the API
+    await client.chat("plan goa")
+    assert len(requests_seen) == 2
+
+
+@pytest.mark.asyncio
+async def test_chat_semantic_cache_is_scoped(requests_seen: list) -> None:
+    """Test that a prompt with a swapped destination never reuses another trip's answer."""
+    client = GroqClient(api_key="test-key", cache=SemanticCache())
+    goa = "plan a 5 day trip to goa with beaches and food on a budget of 50000"
+    pune = goa.replace("goa", "pune")
+
+    await client.chat(goa, temperature=0, cache_scope=("Goa", 50000))
+    await client.chat(goa + " please", temperature=0, cache_scope=("Goa", 50000))
+    assert len(requests_seen) == 1
+
+    await client.chat(pune, temperature=0, cache_scope=("Pune", 50000))
+    await client.chat(pune, temperature=0)
+    assert len(requests_seen) == 3
+
+
+@pytest.mark.asyncio
+async def test_chat_retries_after_bad_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that unparseable output is not cached, so a retry reaches the API."""
+    bodies = [_sse_body('{"city": '), _sse_body('{"city": "Goa"}')]
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=bodies[len(seen) - 1]
+        )
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(groq_client, "get_http_client", lambda: http)
+    client = GroqClient(api_key="test-key", cache=SemanticCache())
+
+    assert await client.chat("plan goa", temperature=0) == '{"city": '
+    assert await client.chat("plan goa", temperature=0) == '{"city": "Goa"}'
+    assert await client.chat("plan goa", temperature=0) == '{"city": "Goa"}'
+    assert len(seen) == 2
+
+
+@pytest.mark.asyncio
+async def test_chat_compresses_large_bodies(requests_seen: list) -> None:
+    """Test that large request bodies are gzipped when enabled."""
+    client = GroqClient(api_key="test-key", cache=SemanticCache(), compress_requests=True)
+    prompt = "plan a trip to goa " * 100
+
+    assert await client.chat(prompt) == '{"city": "Goa"}'
+    assert requests_seen[0].headers["Content-Encoding"] == "gzip"
+    assert _json_body(requests_seen[0])["messages"][0]["content"] == prompt
+
+
+@pytest.mark.asyncio
+async def test_search_parses_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that search responses are parsed straight from JSON bytes."""
+    payload = {
+        "results": [{"id": "doc-1", "score": 0.9, "content": "Goa beaches"}],
+        "total": 1,
+        "query": "goa",
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=payload)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(groq_client, "get_http_client", lambda: client)
+
+    response = await GroqClient(api_key="test-key").search("goa")
+
+    assert response.total == 1
+    assert response.results[0].content == "Goa beaches"
+    assert response.results[0].metadata == {}
+
+
+def test_explicit_arguments_skip_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a fully specified client never loads settings."""
+    def fail() -> None:
+        raise AssertionError("settings loaded")
+
+    monkeypatch.setattr(groq_client, "get_settings", fail)
+
+    client = GroqClient(
+        api_key="k", model="m", cache=SemanticCache(), compress_requests=False
+    )
+
+    assert client.model == "m"
+    assert client._compress_requests is False
+
+
+def test_api_key_and_model_skip_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that settings are only loaded once a default is actually needed."""
+    loads = []
+    settings = groq_client.get_settings()
+
+    def counting_get_settings():
+        loads.append(1)
+        return settings
+
+    monkeypatch.setattr(groq_client, "get_settings", counting_get_settings)
+
+    client = GroqClient(api_key="k", model="m")
+    assert loads == []
+
+    assert client._compress_requests == settings.groq_compress_requests
+    assert len(loads) == 1
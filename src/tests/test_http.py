@@ -0,0 +1,30 @@
+"""
+Unit tests for the shared HTTP connection pool.
+
+Tests that clients are replaced and closed across event loops.
+"""
+
+import asyncio
+
+import httpx
+
+from src.utils import http
+
+
+def test_http_client_from_previous_loop_is_closed() -> None:
+    """Test that a new event loop closes the shared client of the old one."""
+    async def get_client() -> httpx.AsyncClient:
+        client = http.get_http_client()
+        await asyncio.sleep(0)
+        return client
+
+    async def replace_and_close() -> httpx.AsyncClient:
+        client = await get_client()
+        await http.close_http_client()
+        return client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(replace_and_close())
+
+    assert second is not first
+    assert first.is_closed and second.is_closed
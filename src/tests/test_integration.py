@@ -101,6 +101,40 @@ async def test_a2a_message_flow() -> None:
     assert received.payload == {"test": "data"}
 
 
+@pytest.mark.asyncio
+async def test_a2a_receive_wakes_on_matching_message() -> None:
+    """Test that a waiting receiver gets a matching message as soon as it is sent."""
+    from src.a2a.adapters.in_memory import InMemoryA2AAdapter
+    from src.a2a.protocol import create_proposal_message
+    
+    adapter = InMemoryA2AAdapter()
+    
+    def proposal(correlation_id: str):
+        return create_proposal_message(
+            proposal_data={"corr": correlation_id},
+            trace_id="trace-1",
+            correlation_id=correlation_id,
+            sender="sender-agent",
+            receiver="receiver-agent",
+        )
+    
+    waiting = asyncio.create_task(
+        adapter.receive_message("receiver-agent", timeout=5.0, correlation_id="corr-b")
+    )
+    await asyncio.sleep(0)
+    await adapter.send_message(proposal("corr-a"))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    
+    await adapter.send_message(proposal("corr-b"))
+    received = await asyncio.wait_for(waiting, 0.05)
+    
+    assert received.payload == {"corr": "corr-b"}
+    assert adapter.get_queue_size("receiver-agent") == 1
+    assert await adapter.receive_message("receiver-agent", timeout=0.01, correlation_id="corr-c") is None
+    assert adapter._waiters["receiver-agent"] == []
+
+
 @pytest.mark.asyncio
 async def test_workflow_with_budget_constraints() -> None:
     """Test workflow respects budget constraints."""
@@ -0,0 +1,181 @@
+"""
+Unit tests for interactive planner input validation.
+
+Tests the CLI trip request models used to validate prompted values
+and the on-disk research cache.
+"""
+
+import asyncio
+import json
+import time
+from datetime import date, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from src import interactive_planner
+from src.integrations.mcp_client import MCPToolResponse
+from src.interactive_planner import (
+    CliTripRequest,
+    _load_cached_research,
+    _research_cache_key,
+    _store_cached_research,
+)
+
+
+@pytest.fixture
+def research_cache_dir(tmp_path, monkeypatch):
+    """Point the research cache at a temporary directory."""
+    cache_dir = tmp_path / "research"
+    monkeypatch.setattr(interactive_planner, "RESEARCH_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def test_cli_trip_request_normalizes_inputs() -> None:
+    """Test that raw prompt strings are parsed and normalized."""
+    trip = CliTripRequest.model_validate({
+        "destination": "  Goa ",
+        "start_date": "2026-12-01",
+        "end_date": "2026-12-01",
+        "currency": "inr",
+        "budget_min": "1000",
+        "budget_max": "5000",
+        "interests": "culture, , food",
+    })
+
+    assert trip.destination == "Goa"
+    assert trip.start_date == date(2026, 12, 1)
+    assert trip.currency == "INR"
+    assert trip.interests == ["culture", "food"]
+
+
+def test_cli_trip_request_reports_all_errors() -> None:
+    """Test that every invalid field is reported in one pass."""
+    with pytest.raises(ValidationError) as exc_info:
+        CliTripRequest.model_validate({
+            "destination": "Goa",
+            "start_date": "2026-12-05",
+            "end_date": "2026-12-01",
+            "currency": "rupees",
+            "budget_min": "5000",
+            "budget_max": "1000",
+            "interests": " , ",
+        })
+
+    invalid = {error["loc"][0] for error in exc_info.value.errors()}
+    assert invalid == {"end_date", "currency", "budget_max", "interests"}
+
+
+def test_research_cache_key_is_normalized() -> None:
+    """Test that the cache key ignores case, whitespace and interest order."""
+    start, end = datetime(2026, 12, 1), datetime(2026, 12, 5)
+
+    key = _research_cache_key("Goa", start, end, ["food", "culture"])
+
+    assert key == _research_cache_key("  goa ", start, end, ["Culture ", "food"])
+    assert key != _research_cache_key("Goa", start, datetime(2026, 12, 6), ["food", "culture"])
+    assert len(key) == 16
+
+
+def test_research_cache_round_trip(research_cache_dir) -> None:
+    """Test that stored research loads back and no temp file is left behind."""
+    _store_cached_research("abc", {"weather": "Sunny"})
+
+    assert _load_cached_research("abc") == {"weather": "Sunny"}
+    assert [p.name for p in research_cache_dir.iterdir()] == ["abc.json"]
+    assert _load_cached_research("missing") is None
+
+
+def test_research_cache_expires_after_ttl(research_cache_dir, monkeypatch) -> None:
+    """Test that entries older than the 24h TTL are ignored."""
+    _store_cached_research("abc", {"weather": "Sunny"})
+    entry = json.loads((research_cache_dir / "abc.json").read_text())
+    assert entry["expires_at"] == pytest.approx(time.time() + 24 * 3600, abs=60)
+
+    later = time.time() + 24 * 3600 + 1
+    monkeypatch.setattr(interactive_planner.time, "time", lambda: later)
+
+    assert _load_cached_research("abc") is None
+
+
+def _research_patches(monkeypatch, result: dict) -> list:
+    """Stub the MCP research calls, recording each research start."""
+    calls = []
+
+    async def fake_invoke(tool_name, arguments, trace_id, correlation_id):
+        calls.append((tool_name, arguments))
+        return MCPToolResponse(
+            tool_name=tool_name,
+            result={"job_id": "job-1"},
+            trace_id=trace_id,
+            correlation_id=correlation_id,
+        )
+
+    async def fake_await(job_id, trace_id, correlation_id):
+        return MCPToolResponse(
+            tool_name="gemini_research_poll",
+            result=result,
+            trace_id=trace_id,
+            correlation_id=correlation_id,
+        )
+
+    monkeypatch.setattr(interactive_planner, "invoke_mcp_tool", fake_invoke)
+    monkeypatch.setattr(interactive_planner, "_await_research_job", fake_await)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_search_destination_info_skips_caching_mock_results(research_cache_dir, monkeypatch) -> None:
+    """Test that mock research is returned but never written to the cache."""
+    _research_patches(monkeypatch, {"weather_summary": "Mock", "is_mock": True})
+
+    info = await interactive_planner.search_destination_info(
+        "Goa", datetime(2026, 12, 1), datetime(2026, 12, 5), "Mumbai", (1000, 5000), "INR"
+    )
+
+    assert info["weather"] == "Mock"
+    assert not research_cache_dir.exists() or not any(research_cache_dir.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_search_destination_info_uses_cache(research_cache_dir, monkeypatch) -> None:
+    """Test that real research is cached and served without a second MCP call."""
+    calls = _research_patches(monkeypatch, {"weather_summary": "Sunny", "is_mock": False})
+    args = ("Goa", datetime(2026, 12, 1), datetime(2026, 12, 5), "Mumbai", (1000, 5000), "INR")
+
+    first = await interactive_planner.search_destination_info(*args)
+    second = await interactive_planner.search_destination_info(*args)
+
+    assert first == second
+    assert first["weather"] == "Sunny"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_await_research_job_cancels_on_timeout(monkeypatch) -> None:
+    """Test that a job still running at the timeout is cancelled and dropped."""
+    from src.integrations import mcp_tool_adapter
+    from src.integrations.mcp_tool_adapter import MCPGeminiAdapter
+
+    class NeverFinishingClient:
+        async def research_destination(self, destination: str, **kwargs):
+            await asyncio.Event().wait()
+
+    adapter = MCPGeminiAdapter(NeverFinishingClient())
+    monkeypatch.setattr(mcp_tool_adapter, "get_tool_adapters", lambda: {
+        "gemini_research_poll": adapter.poll_research,
+        "gemini_research_cancel": adapter.cancel_research,
+    })
+    monkeypatch.setattr(interactive_planner, "RESEARCH_POLL_INITIAL_DELAY", 0.01)
+    monkeypatch.setattr(interactive_planner, "RESEARCH_POLL_MAX_DELAY", 0.01)
+    monkeypatch.setattr(interactive_planner, "RESEARCH_POLL_TIMEOUT_SECONDS", 0.05)
+
+    job_id = (await adapter.start_research("Goa"))["job_id"]
+    task = adapter._jobs[job_id]
+
+    response = await interactive_planner._await_research_job(job_id, "t1", "c1")
+
+    assert response.error == "Research job timed out"
+    assert adapter._jobs == {}
+    with pytest.raises(asyncio.CancelledError):
+        await task
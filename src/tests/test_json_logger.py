@@ -0,0 +1,92 @@
+"""
+Unit tests for the structured JSON logger.
+
+Tests record formatting and deferred rendering of preview fields.
+"""
+
+import json
+import logging
+
+from src.logging.json_logger import Preview, PreviewFilter, StructuredFormatter, dumps, get_logger
+
+
+def _record(**extra) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_preview_truncates_when_rendered() -> None:
+    """Test that previews render as JSON and are truncated to the limit."""
+    assert Preview({"a": 1}).render() == '{"a": 1}'
+    assert Preview({"key": "x" * 200}, limit=20).render() == '{"key": "' + "x" * 11 + "..."
+
+
+def test_preview_filter_renders_fields() -> None:
+    """Test that the filter renders previews before formatting."""
+    record = _record(arguments=Preview({"destination": "Goa"}))
+
+    assert PreviewFilter().filter(record)
+    output = json.loads(StructuredFormatter().format(record))
+
+    assert output["arguments"] == '{"destination": "Goa"}'
+
+
+def test_formatter_includes_extras_only() -> None:
+    """Test that context and extra fields are emitted, standard attributes are not."""
+    record = _record(trace_id="t1", agent_id="a1", destination="Goa")
+
+    output = json.loads(StructuredFormatter().format(record))
+
+    assert output["trace_id"] == "t1"
+    assert output["agent_id"] == "a1"
+    assert output["destination"] == "Goa"
+    assert "lineno" not in output and "args" not in output
+
+
+def test_get_logger_reuses_handlers() -> None:
+    """Test that repeated get_logger calls do not rebuild handlers."""
+    from src.logging.json_logger import get_logger
+
+    first = get_logger("test.reuse")
+    handler = first.handlers[0]
+    second = get_logger("test.reuse")
+
+    assert second is first
+    assert second.handlers == [handler]
+
+
+def test_get_logger_shares_formatter() -> None:
+    """Test that loggers share one formatter instance."""
+    from src.logging.json_logger import get_logger
+
+    first = get_logger("test.shared.a").handlers[0]
+    second = get_logger("test.shared.b").handlers[0]
+
+    assert first.formatter is second.formatter
+
+
+def test_formatter_timestamp_from_record() -> None:
+    """Test that timestamps come from the record's creation time."""
+    record = _record()
+    record.created = 1700000000.25
+
+    output = json.loads(StructuredFormatter().format(record))
+
+    assert output["timestamp"] == "2023-11-14T22:13:20.250000"
+
+
+def test_dumps_accepts_non_string_keys() -> None:
+    """Test that dicts with int keys serialize with either JSON backend."""
+    assert json.loads(dumps({"days": {1: "Goa", 2: "Pune"}})) == {"days": {"1": "Goa", "2": "Pune"}}
+
+
+def test_get_logger_configures_once_and_replaces_foreign_handlers() -> None:
+    """Test that get_logger is memoized and owns the handlers it configures."""
+    logging.getLogger("test.foreign").addHandler(logging.NullHandler())
+
+    logger = get_logger("test.foreign")
+
+    assert get_logger("test.foreign") is logger
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], logging.StreamHandler)
@@ -0,0 +1,213 @@
+"""
+Unit tests for the MCP client.
+
+Tests batched invocation and coalescing of duplicate in-flight calls
+to idempotent tools.
+"""
+
+import asyncio
+
+import pytest
+
+from src.integrations.mcp_client import MCPClient, MCPToolRequest
+
+
+def _request(query: str, trace_id: str) -> MCPToolRequest:
+    return MCPToolRequest(
+        tool_name="duckduckgo_search",
+        arguments={"query": query},
+        trace_id=trace_id,
+        correlation_id=f"corr-{trace_id}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_invoke_tools_batch_coalesces_duplicates() -> None:
+    """Test that identical concurrent requests share one tool call."""
+    calls = []
+
+    async def search(query: str) -> str:
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return f"results for {query}"
+
+    client = MCPClient()
+    responses = await client.invoke_tools_batch(
+        [_request("goa", "t1"), _request("goa", "t2"), _request("paris", "t3")],
+        {"duckduckgo_search": search},
+    )
+
+    assert sorted(calls) == ["goa", "paris"]
+    assert [r.result for r in responses] == [
+        "results for goa", "results for goa", "results for paris"
+    ]
+    assert [r.trace_id for r in responses] == ["t1", "t2", "t3"]
+    assert responses[1].correlation_id == "corr-t2"
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_invoke_tool_unknown_tool() -> None:
+    """Test that unknown tools return an error response."""
+    client = MCPClient()
+    request = MCPToolRequest(
+        tool_name="missing", arguments={}, trace_id="t1", correlation_id="c1"
+    )
+
+    response = await client.invoke_tool(request, {})
+
+    assert response.result is None
+    assert "Unknown MCP tool" in response.error
+
+
+@pytest.mark.asyncio
+async def test_invoke_tool_rejects_invalid_arguments() -> None:
+    """Test that arguments are validated against the tool input schema."""
+    calls = []
+
+    async def search(query: str, max_results: int = 10) -> str:
+        calls.append(query)
+        return "ok"
+
+    client = MCPClient()
+    request = MCPToolRequest(
+        tool_name="duckduckgo_search",
+        arguments={"max_results": "ten"},
+        trace_id="t1",
+        correlation_id="c1",
+    )
+
+    response = await client.invoke_tool(request, {"duckduckgo_search": search})
+
+    assert calls == []
+    assert "Invalid arguments" in response.error
+
+
+@pytest.mark.asyncio
+async def test_invoke_tool_response_serializes() -> None:
+    """Test that responses built without validation still serialize fully."""
+    client = MCPClient()
+
+    response = await client.invoke_tool(
+        _request("goa", "t1"), {"duckduckgo_search": lambda query: [query]}
+    )
+
+    assert response.model_dump() == {
+        "tool_name": "duckduckgo_search",
+        "result": ["goa"],
+        "error": None,
+        "trace_id": "t1",
+        "correlation_id": "corr-t1",
+        "metadata": {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_sync_tools_run_off_the_event_loop() -> None:
+    """Test that sync tool implementations run in a worker thread."""
+    import threading
+
+    threads = []
+
+    def search(query: str) -> str:
+        threads.append(threading.get_ident())
+        return f"results for {query}"
+
+    client = MCPClient()
+    response = await client.invoke_tool(_request("goa", "t1"), {"duckduckgo_search": search})
+
+    assert response.result == "results for goa"
+    assert threads and threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_invoke_tool_bounds_concurrency() -> None:
+    """Test that in-flight calls per tool are capped."""
+    active = [0]
+    peak = [0]
+
+    async def search(query: str) -> str:
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        return query
+
+    client = MCPClient()
+    client.max_concurrent_per_tool = 2
+    responses = await client.invoke_tools_batch(
+        [_request(f"q{i}", f"t{i}") for i in range(6)],
+        {"duckduckgo_search": search},
+    )
+
+    assert [r.result for r in responses] == [f"q{i}" for i in range(6)]
+    assert peak[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesced_call_survives_leader_cancellation() -> None:
+    """Test that cancelling the first caller does not cancel the others."""
+    release = asyncio.Event()
+
+    async def search(query: str) -> dict:
+        await release.wait()
+        return {"query": query}
+
+    client = MCPClient()
+    tools = {"duckduckgo_search": search}
+    leader = asyncio.ensure_future(client.invoke_tool(_request("goa", "t1"), tools))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(client.invoke_tool(_request("goa", "t2"), tools))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    response = await follower
+    assert leader.cancelled()
+    assert response.result == {"query": "goa"}
+    assert response.trace_id == "t2"
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_results_are_isolated() -> None:
+    """Test that callers sharing a call each get their own result objects."""
+    async def search(query: str) -> dict:
+        await asyncio.sleep(0.01)
+        return {"results": [query]}
+
+    client = MCPClient()
+    first, second = await client.invoke_tools_batch(
+        [_request("goa", "t1"), _request("goa", "t2")],
+        {"duckduckgo_search": search},
+    )
+
+    first.result["results"].append("mutated")
+    assert second.result == {"results": ["goa"]}
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_tools_are_not_coalesced() -> None:
+    """Test that tools outside COALESCED_TOOLS run once per caller."""
+    calls = []
+
+    async def generate(prompt: str) -> str:
+        calls.append(prompt)
+        answer = f"answer {len(calls)}"
+        await asyncio.sleep(0.01)
+        return answer
+
+    client = MCPClient()
+    requests = [
+        MCPToolRequest(
+            tool_name="groq_llm", arguments={"prompt": "plan goa"},
+            trace_id=trace_id, correlation_id="c1",
+        )
+        for trace_id in ("t1", "t2")
+    ]
+    responses = await client.invoke_tools_batch(requests, {"groq_llm": generate})
+
+    assert len(calls) == 2
+    assert {r.result for r in responses} == {"answer 1", "answer 2"}
@@ -0,0 +1,168 @@
+"""
+Unit tests for MCP tool adapters.
+
+Tests lazy construction of the tool adapter registry, the calculator tool
+and background research jobs.
+"""
+
+import asyncio
+
+import pytest
+
+from src.integrations.calculator import BudgetCalculator
+from src.integrations.gemini_research import ResearchResult
+from src.integrations.mcp_client import MCPClient
+from src.integrations.mcp_tool_adapter import (
+    LazyToolAdapters,
+    MCPCalculatorAdapter,
+    MCPGeminiAdapter,
+    MCPGroqAdapter,
+)
+
+
+def test_lazy_tool_adapters_build_on_first_access() -> None:
+    """Test that only accessed adapters are constructed, and only once."""
+    built = []
+
+    def factory(name: str):
+        def build():
+            built.append(name)
+            return name.upper()
+        return build
+
+    adapters = LazyToolAdapters({"a": factory("a"), "b": factory("b")})
+
+    assert "a" in adapters and "missing" not in adapters
+    assert len(adapters) == 2
+    assert built == []
+
+    assert adapters["a"] == "A"
+    assert adapters["a"] == "A"
+    assert built == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_calculator_converts_all_amounts_with_cached_rate() -> None:
+    """Test that conversion uses one cached rate for every amount."""
+    calculator = BudgetCalculator()
+    adapter = MCPCalculatorAdapter(calculator)
+
+    result = await adapter.calculate(
+        "convert_currency", amounts=[10, 20], from_currency="USD", to_currency="INR"
+    )
+
+    assert result["converted_amounts"] == [745.0, 1490.0]
+    assert result["converted_amount"] == 745.0
+    assert list(calculator._rate_cache) == [("USD", "INR")]
+    cached_rate = calculator._rate_cache[("USD", "INR")][0]
+    assert await calculator.get_exchange_rate("USD", "INR") is cached_rate
+
+
+@pytest.mark.asyncio
+async def test_calculator_dispatch() -> None:
+    """Test calculator operations and invalid operation handling."""
+    adapter = MCPCalculatorAdapter(BudgetCalculator())
+
+    assert (await adapter.calculate("total_cost", amounts=[1, 2, 3]))["result"] == 6
+    per_day = await adapter.calculate("per_day", amounts=[100, 50], num_days=3)
+    assert per_day["per_day"] == 50
+
+    with pytest.raises(ValueError, match="per_day requires a non-zero num_days"):
+        await adapter.calculate("per_day", amounts=[100])
+    with pytest.raises(ValueError, match="per_day requires a non-zero num_days"):
+        await adapter.calculate("per_day", amounts=[100], num_days=0)
+    with pytest.raises(ValueError, match="convert_currency requires"):
+        await adapter.calculate("convert_currency", amounts=[100], from_currency="USD")
+    with pytest.raises(ValueError, match="Invalid calculator operation"):
+        await adapter.calculate("divide", amounts=[100])
+
+
+@pytest.mark.asyncio
+async def test_invoke_mcp_tools_batch_stop_on_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that calls queued behind a failure are skipped."""
+    from src.integrations import mcp_tool_adapter
+
+    async def calculate(operation: str, **kwargs) -> dict:
+        if operation == "budget_check":
+            raise ValueError("boom")
+        return {"operation": operation}
+
+    client = MCPClient()
+    client.max_concurrent_per_tool = 1
+    monkeypatch.setattr(mcp_tool_adapter, "get_mcp_client", lambda: client)
+    monkeypatch.setattr(
+        mcp_tool_adapter, "get_tool_adapters", lambda: {"calculator": calculate}
+    )
+
+    responses = await mcp_tool_adapter.invoke_mcp_tools_batch(
+        [
+            {"tool_name": "calculator", "arguments": {"operation": "budget_check"}},
+            {"tool_name": "calculator", "arguments": {"operation": "total_cost"}},
+        ],
+        trace_id="t1",
+        correlation_id="c1",
+        stop_on_error=True,
+    )
+
+    assert "boom" in responses[0].error
+    assert responses[1].error.startswith("Skipped")
+    assert responses[1].trace_id == "t1"
+
+
+class _SlowResearchClient:
+    """Research client that finishes only when released."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+
+    async def research_destination(self, destination: str, **kwargs) -> ResearchResult:
+        await self.release.wait()
+        return ResearchResult(
+            destination=destination,
+            weather_summary="sunny",
+            accommodation_suggestions="",
+            top_attractions="",
+            estimated_daily_cost=100.0,
+            currency="INR",
+            travel_tips="",
+            best_time_to_visit="",
+        )
+
+
+@pytest.mark.asyncio
+async def test_gemini_research_job_start_and_poll() -> None:
+    """Test that research jobs start immediately and are polled to completion."""
+    client = _SlowResearchClient()
+    adapter = MCPGeminiAdapter(client)
+
+    started = await adapter.start_research("Goa")
+    job_id = started["job_id"]
+    assert started["status"] == "running"
+    assert (await adapter.poll_research(job_id))["status"] == "running"
+
+    client.release.set()
+    await asyncio.wait([adapter._jobs[job_id]])
+
+    polled = await adapter.poll_research(job_id)
+    assert polled["status"] == "done"
+    assert polled["result"]["weather_summary"] == "sunny"
+
+    # Finished jobs are forgotten once their result has been collected
+    with pytest.raises(ValueError):
+        await adapter.poll_research(job_id)
+
+
+@pytest.mark.asyncio
+async def test_groq_adapter_passes_temperature() -> None:
+    """Test that the requested temperature reaches the Groq client."""
+    seen = []
+
+    class FakeGroqClient:
+        async def chat(self, prompt: str, temperature: float = 0.7, **kwargs) -> str:
+            seen.append(temperature)
+            return "{}"
+
+    result = await MCPGroqAdapter(FakeGroqClient()).generate("plan goa", temperature=0)
+
+    assert seen == [0]
+    assert result["response"] == "{}"
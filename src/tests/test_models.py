@@ -168,6 +168,19 @@ def test_itinerary_markdown_export() -> None:
     assert "USD 2250" in markdown
 
 
+def test_format_datetime_respects_timezone() -> None:
+    """Test that memoized formatting keeps equal instants in different zones apart."""
+    from datetime import timedelta, timezone
+
+    from src.models.itinerary import _format_datetime
+
+    utc = datetime(2025, 12, 1, 10, 0, tzinfo=timezone.utc)
+    plus_one = utc.astimezone(timezone(timedelta(hours=1)))
+
+    assert _format_datetime(utc, "%I:%M %p") == "10:00 AM"
+    assert _format_datetime(plus_one, "%I:%M %p") == "11:00 AM"
+
+
 def test_monitoring_event() -> None:
     """Test MonitoringEvent model."""
     event = MonitoringEvent(
@@ -190,6 +203,42 @@ def test_monitoring_event() -> None:
     assert log_dict["event_id"] == "evt-123"
     assert log_dict["event_type"] == "task_start"
     assert log_dict["message"] == "Test event"
+    assert log_dict["timestamp"] == event.timestamp.isoformat()
+    assert list(log_dict) == list(MonitoringEvent.model_fields)
+
+
+def test_monitoring_event_log_dict_unserializable_data() -> None:
+    """Test that to_log_dict passes through data pydantic cannot serialize."""
+    marker = object()
+    event = MonitoringEvent(
+        event_id="evt-456",
+        event_type=EventType.TASK_ERROR,
+        trace_id="trace-abc",
+        correlation_id="corr-xyz",
+        message="Odd data",
+        data={"obj": marker},
+    )
+    
+    log_dict = event.to_log_dict()
+    assert log_dict["severity"] == "info"
+    assert log_dict["data"]["obj"] is marker
+
+
+def test_models_built_at_import() -> None:
+    """Test that validators and serializers are built once at import, not on first use."""
+    for model in (
+        TravelerPreferences,
+        TravelerProfile,
+        Location,
+        PricingBreakdown,
+        Offer,
+        ItinerarySegment,
+        Itinerary,
+        MonitoringEvent,
+    ):
+        assert model.__pydantic_complete__, model.__name__
+        assert not model.model_config.get("defer_build"), model.__name__
+        assert not model.model_config.get("validate_assignment"), model.__name__
 
 
 def test_json_roundtrip() -> None:
@@ -210,9 +259,8 @@ def test_json_roundtrip() -> None:
     # Serialize
     json_str = original.model_dump_json()
     
-    # Deserialize
-    data = json.loads(json_str)
-    restored = Offer(**data)
+    # Deserialize straight from JSON
+    restored = Offer.model_validate_json(json_str)
     
     assert restored.offer_id == original.offer_id
     assert restored.offer_type == original.offer_type
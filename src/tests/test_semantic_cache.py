@@ -0,0 +1,121 @@
+"""
+Unit tests for the semantic LLM response cache.
+
+Tests similarity lookups, namespacing, TTL expiry and LRU eviction.
+"""
+
+from src.integrations.semantic_cache import SemanticCache, cosine_similarity, hashed_embedding
+
+
+def test_hashed_embedding_similarity() -> None:
+    """Test that reworded prompts embed closer than unrelated ones."""
+    base = hashed_embedding("plan a 3 day trip to goa with beaches and food")
+    reworded = hashed_embedding("Plan a 3-day trip to Goa with beaches and food!")
+    unrelated = hashed_embedding("convert 100 usd to eur")
+
+    assert cosine_similarity(base, reworded) > 0.99
+    assert cosine_similarity(base, unrelated) < 0.5
+
+
+def test_semantic_cache_hit_and_miss() -> None:
+    """Test lookups for similar and dissimilar prompts."""
+    cache = SemanticCache()
+    cache.store("plan a 3 day trip to goa with beaches and food", "itinerary-goa")
+
+    assert cache.lookup("Plan a 3-day trip to Goa with beaches and food") == "itinerary-goa"
+    assert cache.lookup("what is the weather in oslo in winter") is None
+
+
+def test_semantic_cache_namespaces() -> None:
+    """Test that entries are only returned within their namespace."""
+    cache = SemanticCache()
+    cache.store("plan a trip to goa", "creative", namespace=("model", 0.7))
+
+    assert cache.lookup("plan a trip to goa", namespace=("model", 0.7)) == "creative"
+    assert cache.lookup("plan a trip to goa", namespace=("model", 0.0)) is None
+
+
+def test_semantic_cache_ttl() -> None:
+    """Test that expired entries are not returned."""
+    now = [0.0]
+    cache = SemanticCache(ttl_seconds=10, clock=lambda: now[0])
+    cache.store("plan a trip to goa", "itinerary")
+
+    now[0] = 5.0
+    assert cache.lookup("plan a trip to goa") == "itinerary"
+
+    now[0] = 11.0
+    assert cache.lookup("plan a trip to goa") is None
+    assert len(cache) == 0
+
+
+def test_semantic_cache_lru_eviction() -> None:
+    """Test that the least recently used entry is evicted when full."""
+    cache = SemanticCache(max_entries=2)
+    cache.store("plan a trip to goa", "goa")
+    cache.store("plan a trip to paris", "paris")
+
+    # Touch goa so paris becomes least recently used
+    assert cache.lookup("plan a trip to goa") == "goa"
+    cache.store("weather in tokyo tomorrow", "tokyo")
+
+    assert len(cache) == 2
+    assert cache.lookup("plan a trip to goa") == "goa"
+    assert cache.lookup("weather in tokyo tomorrow") == "tokyo"
+
+
+def test_exact_tier_skips_embedding() -> None:
+    """Test that exact repeats are served without computing an embedding."""
+    calls = []
+
+    def embed(text: str) -> list:
+        calls.append(text)
+        return hashed_embedding(text)
+
+    cache = SemanticCache(embed=embed)
+    cache.store("plan a trip to goa", "itinerary")
+    calls.clear()
+
+    assert cache.lookup("plan a trip to goa") == "itinerary"
+    assert calls == []
+
+
+def test_exact_only_cache() -> None:
+    """Test that semantic matching can be disabled."""
+    cache = SemanticCache(semantic=False)
+    cache.store("plan a 3 day trip to goa with beaches and food", "itinerary")
+
+    assert cache.lookup("plan a 3 day trip to goa with beaches and food") == "itinerary"
+    assert cache.lookup("Plan a 3-day trip to Goa with beaches and food") is None
+
+
+def test_embed_batch_memoizes() -> None:
+    """Test that embed_batch only embeds texts it has not seen."""
+    batches = []
+
+    def embed_batch(texts: list) -> list:
+        batches.append(list(texts))
+        return [hashed_embedding(t) for t in texts]
+
+    cache = SemanticCache(embed_batch=embed_batch)
+    first = cache.embed_batch(["goa", "paris", "goa"])
+    cache.store("paris", "itinerary")
+    second = cache.embed_batch(["paris", "tokyo"])
+
+    assert batches == [["goa", "paris"], ["tokyo"]]
+    assert first[0] == first[2]
+    assert second[0] == first[1]
+
+
+def test_swapped_destination_misses_across_scopes() -> None:
+    """Test that a prompt differing only in destination is not served across namespaces."""
+    goa = "Plan a 5 day trip to Goa from 2026-12-01 to 2026-12-05 with a budget of INR 50000, beaches and food"
+    pune = goa.replace("Goa", "Pune")
+    cache = SemanticCache()
+    cache.store(goa, "itinerary-goa", namespace=("Goa", "2026-12-01", 50000))
+
+    # Similar enough to hit within one namespace...
+    assert cosine_similarity(hashed_embedding(goa), hashed_embedding(pune)) > cache.threshold
+    assert cache.lookup(pune, namespace=("Pune", "2026-12-01", 50000)) is None
+    # ...so unscoped callers must opt out of the semantic tier
+    assert cache.lookup(pune, namespace=("Goa", "2026-12-01", 50000), semantic=False) is None
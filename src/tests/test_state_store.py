@@ -23,6 +23,21 @@ async def test_inmemory_store_set_get() -> None:
     assert value == {"data": "value"}
 
 
+@pytest.mark.asyncio
+async def test_inmemory_store_sync_and_async_share_data() -> None:
+    """Test that sync variants operate on the same data as the async API."""
+    store = InMemoryStateStore()
+    
+    assert store.set_sync("sync-key", 1)
+    assert await store.get("sync-key") == 1
+    
+    await store.set("async-key", 2)
+    assert store.get_sync("async-key") == 2
+    assert sorted(store.list_keys_sync("*-key")) == ["async-key", "sync-key"]
+    assert store.delete_sync("async-key")
+    assert not await store.exists("async-key")
+
+
 @pytest.mark.asyncio
 async def test_inmemory_store_delete() -> None:
     """Test delete operation."""
@@ -71,28 +86,64 @@ async def test_inmemory_store_list_keys() -> None:
     flight_keys = await store.list_keys("flight:*")
     assert len(flight_keys) == 2
     assert all(k.startswith("flight:") for k in flight_keys)
+    
+    # Wildcards may appear anywhere in the pattern
+    await store.set("flight:123:offers", [])
+    assert await store.list_keys("flight:*:offers") == ["flight:123:offers"]
+    assert await store.list_keys("*:789") == ["hotel:789"]
 
 
 @pytest.mark.asyncio
 async def test_inmemory_store_ttl() -> None:
     """Test TTL (time-to-live) expiration."""
-    store = InMemoryStateStore()
+    now = [0.0]
+    store = InMemoryStateStore(clock=lambda: now[0])
     
     # Set with very short TTL
     await store.set("expires-soon", "value", ttl=1)
     
-    # Should exist immediately
+    # Should exist immediately and until the deadline
+    assert await store.exists("expires-soon")
+    now[0] = 0.9
     assert await store.exists("expires-soon")
     
-    # Wait for expiration
-    import asyncio
-    await asyncio.sleep(1.1)
+    # Advance the clock past expiration
+    now[0] = 1.1
     
     # Should be expired
     value = await store.get("expires-soon")
     assert value is None
 
 
+@pytest.mark.asyncio
+async def test_inmemory_store_ttl_overwrite() -> None:
+    """Test that overwriting a key discards its earlier expiry."""
+    store = InMemoryStateStore()
+    
+    await store.set("renewed", "old", ttl=0)
+    await store.set("renewed", "new")
+    await store.set("expired", "value", ttl=0)
+    
+    assert await store.get("renewed") == "new"
+    assert not await store.exists("expired")
+    assert store._expiry_heap == []
+
+
+@pytest.mark.asyncio
+async def test_inmemory_store_skips_cleanup_without_ttls(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that expiry cleanup is skipped when no key has a TTL."""
+    store = InMemoryStateStore()
+    
+    def fail() -> None:
+        raise AssertionError("cleanup should not run")
+    
+    monkeypatch.setattr(store, "_cleanup_expired", fail)
+    await store.set("key", "value")
+    
+    assert await store.get("key") == "value"
+    assert await store.list_keys() == ["key"]
+
+
 @pytest.mark.asyncio
 async def test_inmemory_store_clear() -> None:
     """Test clear operation."""
@@ -0,0 +1,58 @@
+"""
+Shared HTTP connection pool for the API clients.
+"""
+
+import asyncio
+from typing import Optional, Set
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Shared HTTP client: keep-alive connections and TLS sessions are reused
+# across every API client instead of being rebuilt per client
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+# Close tasks for clients left behind by a previous event loop
+_closing: Set["asyncio.Task[None]"] = set()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client for the running event loop.
+    
+    HTTP/2 multiplexing is enabled when the h2 package is installed. A
+    client left open by a previous event loop (e.g. an earlier
+    asyncio.run()) is closed in the background before it is replaced.
+    
+    Returns:
+        Shared async HTTP client
+    """
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        if _shared_client is not None and not _shared_client.is_closed:
+            task = loop.create_task(_shared_client.aclose())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+        _shared_client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            headers={"Connection": "keep-alive"},
+            http2=_HTTP2_AVAILABLE,
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
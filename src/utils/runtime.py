@@ -0,0 +1,26 @@
+"""
+Event loop setup shared by the CLI entry points.
+"""
+
+import asyncio
+import sys
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop's event loop for subsequent asyncio.run() calls if available.
+    
+    uvloop does not support Windows, where the stock loop is kept.
+    
+    Returns:
+        True if uvloop was installed
+    """
+    if uvloop is None or sys.platform == "win32":
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
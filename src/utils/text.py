@@ -0,0 +1,15 @@
+"""
+Helpers for cleaning up LLM text responses.
+"""
+
+
+def strip_code_fence(text: str) -> str:
+    """Remove the markdown code fence LLMs sometimes wrap JSON in."""
+    text = text.strip()
+    if text.startswith("```json"):
+        text = text[7:]
+    if text.startswith("```"):
+        text = text[3:]
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
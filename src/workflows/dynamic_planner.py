@@ -9,6 +9,7 @@ Orchestrates the multi-agent travel planning workflow including:
 """
 
 import asyncio
+import functools
 import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -35,6 +36,29 @@ from src.logging.json_logger import get_logger
 
 logger = get_logger(__name__)
 
+# Split of an itinerary total into base price, taxes and fees
+_BASE_SHARE = Decimal("0.85")
+_TAX_SHARE = Decimal("0.10")
+_FEE_SHARE = Decimal("0.05")
+_ZERO = Decimal("0")
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a plan amount to Decimal, skipping the str() round-trip for ints."""
+    if isinstance(value, Decimal):
+        return value
+    if type(value) is int:
+        return Decimal(value)
+    # Floats go through str() so 0.1 stays 0.1 rather than its binary expansion
+    return Decimal(str(value))
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_clock_time(value: str) -> tuple[int, int]:
+    """Parse a 12-hour clock time like '9:00 AM' into (hour, minute)."""
+    parsed = datetime.strptime(value, "%I:%M %p")
+    return parsed.hour, parsed.minute
+
 
 class DynamicPlannerWorkflow:
     """
@@ -124,7 +148,7 @@ class DynamicPlannerWorkflow:
                 message="Assembling final itinerary",
             )
             
-            itinerary = await self._create_itinerary(
+            itinerary = self._create_itinerary(
                 context=context,
                 optimized_plan=optimized_plan,
                 callbacks=callbacks,
@@ -164,12 +188,12 @@ class DynamicPlannerWorkflow:
             parts = [p.strip() for p in time_str.split("-")]
             if len(parts) != 2:
                 return base_date.replace(hour=9, minute=0), base_date.replace(hour=10, minute=0)
-            from datetime import datetime as dtmod
             start_raw, end_raw = parts
-            start_dt = dtmod.strptime(start_raw, "%I:%M %p")
-            end_dt = dtmod.strptime(end_raw, "%I:%M %p")
-            start_full = base_date.replace(hour=start_dt.hour, minute=start_dt.minute, second=0, microsecond=0)
-            end_full = base_date.replace(hour=end_dt.hour, minute=end_dt.minute, second=0, microsecond=0)
+            # Schedules reuse the same few clock times, so parses are cached
+            start_hour, start_minute = _parse_clock_time(start_raw)
+            end_hour, end_minute = _parse_clock_time(end_raw)
+            start_full = base_date.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
+            end_full = base_date.replace(hour=end_hour, minute=end_minute, second=0, microsecond=0)
             # Ensure end after start
             if end_full <= start_full:
                 end_full = start_full + timedelta(hours=1)
@@ -194,12 +218,13 @@ class DynamicPlannerWorkflow:
         """
         a2a_adapter = get_a2a_adapter()
         
-        # Wait for optimized_plan message
+        # Wait for this request's optimized_plan message
         message = await a2a_adapter.receive_message(
-                agent_id="orchestrator",
-                timeout=timeout,
-                message_type=A2AMessageType.OPTIMIZED_PLAN,
-            )
+            agent_id="orchestrator",
+            timeout=timeout,
+            message_type=A2AMessageType.OPTIMIZED_PLAN,
+            correlation_id=context.correlation_id,
+        )
         
         if message:
             logger.info(f"Received optimized plan: {message.message_id}")
@@ -209,140 +234,135 @@ class DynamicPlannerWorkflow:
             logger.warning("Optimization timeout - using original proposal")
             state_store = await get_state_store()
             
-            # Fallback to state store
-            optimized = await state_store.get(f"optimized_plan:{context.task_id}")
-            if not optimized:
-                # Try correlation_id key used by ADK agent
-                optimized = await state_store.get(f"optimized_plan:{context.correlation_id}")
+            # Fallback to state store (the ADK agent keys plans by correlation ID)
+            optimized = await state_store.get(f"optimized_plan:{context.correlation_id}")
             if optimized:
                 return optimized
             
             # Final fallback - return empty optimization
             return {"flights": [], "hotels": [], "activities": []}
     
-    async def _create_itinerary(
+    def _build_offer_segments(
         self,
-        context: TaskContext,
-        optimized_plan: Dict[str, Any],
-        callbacks: MonitoringCallbacks,
-    ) -> Itinerary:
+        offers: List[Dict[str, Any]],
+        segment_type: OfferType,
+        default_location: Location,
+        start_date: datetime,
+        end_date: datetime,
+        order_start: int,
+        id_prefix: str,
+    ) -> List[ItinerarySegment]:
         """
-        Create final itinerary from optimized plan.
+        Build day-1 segments for flight or hotel offers.
+        
+        Flights keep their own times when given; hotels span the whole trip.
         
         Args:
-            context: Task context
-            optimized_plan: Optimized plan data
-            callbacks: Monitoring callbacks
+            offers: Offer data dictionaries
+            segment_type: OfferType.FLIGHT or OfferType.HOTEL
+            default_location: Location used when an offer has none
+            start_date: Trip start
+            end_date: Trip end
+            order_start: Order of the first segment
+            id_prefix: Per-itinerary prefix for generated IDs
             
         Returns:
-            Complete itinerary
+            Segments in offer order
         """
-        destination = context.request_params.get("destination", "Unknown")
-        start_date = datetime.fromisoformat(
-            context.request_params.get("start_date", datetime.utcnow().isoformat())
-        )
-        end_date = datetime.fromisoformat(
-            context.request_params.get("end_date", datetime.utcnow().isoformat())
-        )
-        
-        # Build segments from optimized offers AND daily schedule
+        is_flight = segment_type == OfferType.FLIGHT
         segments: List[ItinerarySegment] = []
-        order = 0
-        
-        # Add flight segments
-        for flight_data in optimized_plan.get("flights", []):
-            flight = Offer(**flight_data)
+        for order, offer_data in enumerate(offers, order_start):
+            offer = Offer(**offer_data)
             segments.append(
                 ItinerarySegment(
-                    segment_id=f"seg-{uuid.uuid4().hex[:8]}",
+                    segment_id=f"seg-{id_prefix}-{order}",
                     day=1,
-                    start_time=flight.start_time or start_date,
-                    end_time=flight.end_time or start_date,
-                    segment_type=OfferType.FLIGHT,
-                    title=flight.title,
-                    description=flight.description or "",
-                    location=flight.location or Location(
-                        name=destination,
-                        city=destination,
-                        country="",
-                    ),
-                    offer=flight,
+                    start_time=(offer.start_time or start_date) if is_flight else start_date,
+                    end_time=(offer.end_time or start_date) if is_flight else end_date,
+                    segment_type=segment_type,
+                    title=offer.title,
+                    description=offer.description or "",
+                    location=offer.location or default_location,
+                    offer=offer,
                     order=order,
                 )
             )
-            order += 1
+        return segments
+    
+    def _build_activity_segments(
+        self,
+        daily_schedule: List[Dict[str, Any]],
+        destination: str,
+        default_location: Location,
+        start_date: datetime,
+        order_start: int,
+        id_prefix: str,
+    ) -> List[ItinerarySegment]:
+        """
+        Build segments for the activities in a daily schedule.
         
-        # Add hotel segments
-        for hotel_data in optimized_plan.get("hotels", []):
-            hotel = Offer(**hotel_data)
-            segments.append(
-                ItinerarySegment(
-                    segment_id=f"seg-{uuid.uuid4().hex[:8]}",
-                    day=1,
-                    start_time=start_date,
-                    end_time=end_date,
-                    segment_type=OfferType.HOTEL,
-                    title=hotel.title,
-                    description=hotel.description or "",
-                    location=hotel.location or Location(
-                        name=destination,
-                        city=destination,
-                        country="",
-                    ),
-                    offer=hotel,
-                    order=order,
-                )
-            )
-            order += 1
+        Activities that fail to build are logged and skipped.
         
-        # Add daily schedule activities as segments
-        daily_schedule = optimized_plan.get("daily_schedule", [])
+        Args:
+            daily_schedule: Day entries with "day" and "activities"
+            destination: Trip destination
+            default_location: Location for activities held at the destination
+            start_date: Trip start (day 1)
+            order_start: Order of the first segment
+            id_prefix: Per-itinerary prefix for generated IDs
+            
+        Returns:
+            Segments in schedule order
+        """
+        segments: List[ItinerarySegment] = []
+        order = order_start
         for day_data in daily_schedule:
             day_num = day_data.get("day", 1)
             base_date = start_date + timedelta(days=day_num - 1)
-
+            
             # Add each activity as a segment with parsed times
             for activity in day_data.get("activities", []):
                 try:
                     cost = activity.get("cost", 0)
                     time_range = activity.get("time", "")
+                    name = activity.get("name", "Activity")
+                    description = activity.get("description", "")
                     start_dt, end_dt = self._parse_time_range(time_range, base_date)
-
+                    location_name = activity.get("location", destination)
+                    location = default_location if location_name == destination else Location(
+                        name=location_name,
+                        city=destination,
+                        country="",
+                    )
+                    
+                    amount = _to_decimal(cost)
                     activity_offer = Offer(
-                        offer_id=f"activity-{uuid.uuid4().hex[:8]}",
+                        offer_id=f"activity-{id_prefix}-{order}",
                         offer_type=OfferType.ACTIVITY,
                         provider=activity.get("location", "Local"),
-                        title=activity.get("name", "Activity"),
-                        description=activity.get("description", ""),
+                        title=name,
+                        description=description,
                         pricing=PricingBreakdown(
-                            base_price=Decimal(str(cost)),
-                            taxes=Decimal("0"),
-                            fees=Decimal("0"),
-                            total=Decimal(str(cost)),
+                            base_price=amount,
+                            taxes=_ZERO,
+                            fees=_ZERO,
+                            total=amount,
                             currency="INR",
                         ),
-                        location=Location(
-                            name=activity.get("location", destination),
-                            city=destination,
-                            country="",
-                        ),
+                        location=location,
                         rating=4.5,
                     )
-
+                    
                     segments.append(
                         ItinerarySegment(
-                            segment_id=f"seg-{uuid.uuid4().hex[:8]}",
+                            segment_id=f"seg-{id_prefix}-{order}",
                             day=day_num,
                             start_time=start_dt,
                             end_time=end_dt,
                             segment_type=OfferType.ACTIVITY,
-                            title=activity.get("name", "Activity"),
-                            description=activity.get("description", ""),
-                            location=Location(
-                                name=activity.get("location", destination),
-                                city=destination,
-                                country="",
-                            ),
+                            title=name,
+                            description=description,
+                            location=location,
                             offer=activity_offer,
                             order=order,
                         )
@@ -350,19 +370,79 @@ class DynamicPlannerWorkflow:
                     order += 1
                 except Exception as e:
                     logger.warning(f"Failed to create activity segment: {e}")
+        return segments
+    
+    def _create_itinerary(
+        self,
+        context: TaskContext,
+        optimized_plan: Dict[str, Any],
+        callbacks: MonitoringCallbacks,
+    ) -> Itinerary:
+        """
+        Create final itinerary from optimized plan.
+        
+        Args:
+            context: Task context
+            optimized_plan: Optimized plan data
+            callbacks: Monitoring callbacks
+            
+        Returns:
+            Complete itinerary
+        """
+        destination = context.request_params.get("destination", "Unknown")
+        start_date = datetime.fromisoformat(
+            context.request_params.get("start_date", datetime.utcnow().isoformat())
+        )
+        end_date = datetime.fromisoformat(
+            context.request_params.get("end_date", datetime.utcnow().isoformat())
+        )
+        
+        # Segment IDs are unique via the task prefix plus each segment's order
+        id_prefix = context.task_id[:8]
+        
+        # One shared (frozen) location for everything without a more specific one
+        default_location = Location(name=destination, city=destination, country="")
+        
+        # Build segments from optimized offers AND daily schedule, numbered
+        # in flight, hotel, activity order
+        segments = self._build_offer_segments(
+            optimized_plan.get("flights", []),
+            OfferType.FLIGHT,
+            default_location,
+            start_date,
+            end_date,
+            order_start=0,
+            id_prefix=id_prefix,
+        )
+        segments += self._build_offer_segments(
+            optimized_plan.get("hotels", []),
+            OfferType.HOTEL,
+            default_location,
+            start_date,
+            end_date,
+            order_start=len(segments),
+            id_prefix=id_prefix,
+        )
+        segments += self._build_activity_segments(
+            optimized_plan.get("daily_schedule", []),
+            destination,
+            default_location,
+            start_date,
+            order_start=len(segments),
+            id_prefix=id_prefix,
+        )
         
         # Calculate total cost from segments and cost breakdown
         cost_breakdown = optimized_plan.get("cost_breakdown", {})
         if cost_breakdown and cost_breakdown.get("total"):
             # Use LLM-provided cost breakdown
-            total_cost = Decimal(str(cost_breakdown.get("total", 0)))
+            total_cost = _to_decimal(cost_breakdown.get("total", 0))
             currency = cost_breakdown.get("currency", "INR")
         else:
             # Fallback: calculate from segments
             total_cost = sum(
-                seg.offer.pricing.total
-                for seg in segments
-                if seg.offer
+                (seg.offer.pricing.total for seg in segments if seg.offer),
+                _ZERO,
             )
             currency = "USD"
         
@@ -374,9 +454,9 @@ class DynamicPlannerWorkflow:
             end_date=end_date,
             segments=segments,
             total_cost=PricingBreakdown(
-                base_price=total_cost * Decimal("0.85"),
-                taxes=total_cost * Decimal("0.10"),
-                fees=total_cost * Decimal("0.05"),
+                base_price=total_cost * _BASE_SHARE,
+                taxes=total_cost * _TAX_SHARE,
+                fees=total_cost * _FEE_SHARE,
                 total=total_cost,
                 currency=currency,
             ),